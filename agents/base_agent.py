@@ -1,31 +1,34 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
-from langchain_ollama import ChatOllama
-from langchain_community.chat_models import ChatAnthropic
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnablePassthrough
 from utils.config import settings
-from core.logging import AgentLogger
+from core.logging import get_agent_logger
+from core.tracing import tracer, traced
+from core.cassette import wrap_llm
 
 class BaseAgent(ABC):
     def __init__(self, name: str, knowledge_base_path: str):
         self.name = name
         self.knowledge_base_path = knowledge_base_path
-        self.logger = AgentLogger(name)
+        self.logger = get_agent_logger(name)
+        
+        # LangChain is imported here rather than at module level to keep CLI startup fast
+        from langchain_core.prompts import ChatPromptTemplate
+        from langchain_core.output_parsers import StrOutputParser
+        from langchain_core.runnables import RunnablePassthrough
         
         # Initialize LLM
         if settings.LLM_PROVIDER == "ollama":
-            self.llm = ChatOllama(
+            from langchain_ollama import ChatOllama
+            self.llm = wrap_llm(ChatOllama(
                 base_url=settings.OLLAMA_API_URL,
                 model=settings.MODEL_NAME
-            )
+            ))
         else:
-            self.llm = ChatAnthropic(
+            from langchain_community.chat_models import ChatAnthropic
+            self.llm = wrap_llm(ChatAnthropic(
                 anthropic_api_key=settings.ANTHROPIC_API_KEY,
                 model_name=settings.MODEL_NAME
-            )
+            ))
         
         # Initialize conversation chain
         self.prompt = ChatPromptTemplate.from_messages([
@@ -53,6 +56,7 @@ class BaseAgent(ABC):
         """Return the system prompt that defines the agent's persona"""
         pass
     
+    @traced(category="agent")
     def process_message(self, message: str, from_agent: Optional[str] = None) -> str:
         """Process incoming message and generate response"""
         # Log incoming message
@@ -77,7 +81,8 @@ class BaseAgent(ABC):
             prompt = message
         
         # Get response from LLM
-        response = self.chain.invoke(prompt)
+        with tracer.span("llm.invoke", category="llm", agent=self.name, prompt_chars=len(prompt)):
+            response = self.chain.invoke(prompt)
         
         # Log response
         self.logger.log_communication(response)
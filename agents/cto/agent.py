@@ -1,6 +1,8 @@
-from typing import Optional
-from langchain_ollama import OllamaLLM
-from core.knowledge_base.knowledge_manager import KnowledgeManager
+from typing import List, Optional
+from core.knowledge_base.knowledge_manager import Document, KnowledgeManager
+from core.tracing import tracer, traced
+from core.cassette import wrap_llm
+from utils.config import settings
 
 class CTOAgent:
     """CTO agent that focuses on technical excellence and system architecture."""
@@ -12,12 +14,9 @@ class CTOAgent:
             system_prompt: Optional custom system prompt
             knowledge_manager: Optional knowledge manager instance
         """
-        self.llm = OllamaLLM(
-            model="llama3.3:latest",  # Using the latest Llama 3.3 model
-            temperature=0.7,
-            num_ctx=4096,  # Increased context window for better responses
-            # Removed stop token for more robust responses
-        )
+        self.name = "CTO"
+        self.model = "llama3.3:latest"  # Using the latest Llama 3.3 model
+        self._llm = None
         self.knowledge_manager = knowledge_manager
         self.system_prompt = system_prompt or """You are a CTO 🎮 focused on technical excellence and system architecture.
 You should:
@@ -27,20 +26,41 @@ You should:
 4. Communicate technical concepts clearly 📊
 5. Keep responses detailed and comprehensive 📝"""
     
-    def process_message(self, message: str, from_agent: Optional[str] = None) -> str:
+    @property
+    def llm(self):
+        """LLM client, created on first use so constructing the agent stays cheap."""
+        if self._llm is None:
+            from langchain_ollama import OllamaLLM
+            self._llm = wrap_llm(OllamaLLM(
+                base_url=settings.OLLAMA_API_URL,
+                model=self.model,
+                temperature=0.7,
+                num_ctx=4096,  # Increased context window for better responses
+                # Removed stop token for more robust responses
+            ))
+        return self._llm
+
+    def retrieve(self, message: str) -> List[Document]:
+        """Query the knowledge base (if available) for documents relevant to a message."""
+        if not self.knowledge_manager:
+            return []
+        return self.knowledge_manager.query_knowledge(message)
+    
+    @traced(category="agent")
+    def process_message(self, message: str, from_agent: Optional[str] = None, relevant_docs: Optional[List[Document]] = None) -> str:
         """Process a message and generate a response.
         
         Args:
             message: The message to process
             from_agent: Optional name of the agent who sent the message
+            relevant_docs: Knowledge base results to use; queried when omitted
             
         Returns:
             The agent's response
         """
-        # Query knowledge base if available
-        relevant_docs = []
-        if self.knowledge_manager:
-            relevant_docs = self.knowledge_manager.query_knowledge(message)
+        # Query knowledge base unless the caller already did
+        if relevant_docs is None:
+            relevant_docs = self.retrieve(message)
         
         # Build the prompt
         prompt = f"{self.system_prompt}\n\n"
@@ -59,5 +79,6 @@ You should:
         prompt += "Please provide a detailed, thoughtful response based on your role, the knowledge provided, and the previous agent's reasoning. Build on their points, add your own insights, and use diagrams or pseudocode as appropriate."
         
         # Generate response
-        response = self.llm.invoke(prompt)
+        with tracer.span("llm.invoke", category="llm", agent=self.name, prompt_chars=len(prompt)):
+            response = self.llm.invoke(prompt)
         return response.strip() 
\ No newline at end of file
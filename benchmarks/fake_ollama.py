@@ -0,0 +1,211 @@
+import argparse
+import json
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional
+
+DEFAULT_RESPONSE = (
+    "From my perspective we should ship an incremental first version, measure how users "
+    "respond, and keep the architecture simple enough to iterate on quickly. "
+)
+
+class FakeOllamaServer:
+    """Local stand-in for the Ollama HTTP API with configurable timing.
+
+    Serves ``/api/generate`` and ``/api/chat`` (streaming and non-streaming),
+    ``/api/tags`` and ``/api/version`` so the LangChain Ollama clients can run
+    against it unchanged.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        token_rate: float = 0.0,
+        response_text: str = DEFAULT_RESPONSE,
+    ):
+        """Initialize the server.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind, 0 picks a free port
+            latency: Seconds to wait before the first token
+            token_rate: Tokens emitted per second, 0 streams without delay
+            response_text: Text returned for every request
+        """
+        self.latency = latency
+        self.token_rate = token_rate
+        self.response_text = response_text
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as ``OLLAMA_API_URL``."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def tokens(self) -> List[str]:
+        """Split the response text into the chunks streamed to clients."""
+        return re.findall(r"\S+\s*", self.response_text)
+
+    def expected_duration(self) -> float:
+        """Server-side time spent producing one full response."""
+        if not self.token_rate:
+            return self.latency
+        return self.latency + len(self.tokens()) / self.token_rate
+
+    def generate(self) -> Iterator[str]:
+        """Yield response chunks, sleeping to emulate latency and token rate."""
+        with self._lock:
+            self.request_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+        delay = 1.0 / self.token_rate if self.token_rate else 0.0
+        for token in self.tokens():
+            if delay:
+                time.sleep(delay)
+            yield token
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def start(self) -> "FakeOllamaServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-ollama", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeOllamaServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+def _make_handler(server: FakeOllamaServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path == "/api/tags":
+                self._send_json({"models": [{"name": "fake:latest", "model": "fake:latest", "size": 0}]})
+            elif self.path == "/api/version":
+                self._send_json({"version": "0.0.0-fake"})
+            else:
+                self._send_text("Ollama is running")
+
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            if self.path not in ("/api/generate", "/api/chat"):
+                self._send_json({"error": f"unsupported path {self.path}"}, status=404)
+                return
+
+            chat = self.path == "/api/chat"
+            model = body.get("model", "fake:latest")
+            started = time.perf_counter()
+            if body.get("stream", True):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                count = 0
+                for token in server.generate():
+                    count += 1
+                    self._write_chunk(_chunk(model, token, chat, done=False))
+                self._write_chunk(_final_chunk(model, chat, count, time.perf_counter() - started))
+                self.wfile.write(b"0\r\n\r\n")
+            else:
+                tokens = list(server.generate())
+                payload = _final_chunk(model, chat, len(tokens), time.perf_counter() - started)
+                payload.update(_chunk(model, "".join(tokens), chat, done=True))
+                self._send_json(payload)
+
+        def _write_chunk(self, payload: Dict) -> None:
+            data = (json.dumps(payload) + "\n").encode()
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+
+        def _send_json(self, payload: Dict, status: int = 200) -> None:
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _send_text(self, text: str) -> None:
+            data = text.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+def _chunk(model: str, text: str, chat: bool, done: bool) -> Dict:
+    payload = {"model": model, "created_at": datetime.now(timezone.utc).isoformat(), "done": done}
+    if chat:
+        payload["message"] = {"role": "assistant", "content": text}
+    else:
+        payload["response"] = text
+    return payload
+
+def _final_chunk(model: str, chat: bool, eval_count: int, elapsed: float) -> Dict:
+    payload = _chunk(model, "", chat, done=True)
+    payload.update({
+        "done_reason": "stop",
+        "total_duration": int(elapsed * 1e9),
+        "load_duration": 0,
+        "prompt_eval_count": 0,
+        "prompt_eval_duration": 0,
+        "eval_count": eval_count,
+        "eval_duration": int(elapsed * 1e9),
+    })
+    return payload
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a fake Ollama server for benchmarks and offline runs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before the first token")
+    parser.add_argument("--token-rate", type=float, default=0.0, help="Tokens per second, 0 for unthrottled")
+    parser.add_argument("--response", default=DEFAULT_RESPONSE, help="Response text returned for every request")
+    args = parser.parse_args()
+
+    server = FakeOllamaServer(args.host, args.port, args.latency, args.token_rate, args.response)
+    print(f"Fake Ollama listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import re
+from typing import Dict, List
+
+def reference_analyze_content(content: List[Dict]) -> Dict:
+    """The original per-pattern AgentProfileScraper.analyze_content, kept to check the compiled matcher against"""
+    analysis = {
+        "goals": [],
+        "motivations": [],
+        "behaviors": [],
+        "pain_points": [],
+        "communication_style": [],
+        "tone": [],
+        "practical_advice": []
+    }
+
+    # Keywords and patterns for different categories
+    patterns = {
+        "goals": [
+            r"aims to", r"goal is to", r"wants to", r"seeks to", r"strives to",
+            r"objective is", r"mission is", r"vision is", r"aspires to"
+        ],
+        "motivations": [
+            r"motivated by", r"driven by", r"inspired by", r"passionate about",
+            r"believes in", r"values", r"cares about", r"dedicated to"
+        ],
+        "behaviors": [
+            r"always", r"typically", r"usually", r"often", r"frequently",
+            r"known for", r"characteristically", r"consistently"
+        ],
+        "pain_points": [
+            r"challenge", r"struggle", r"difficulty", r"problem", r"issue",
+            r"concern", r"worry", r"frustration", r"obstacle"
+        ],
+        "communication_style": [
+            r"speaks", r"communicates", r"expresses", r"articulates",
+            r"presents", r"conveys", r"shares", r"discusses"
+        ],
+        "tone": [
+            r"tone", r"manner", r"style", r"approach", r"attitude",
+            r"demeanor", r"personality", r"character"
+        ],
+        "practical_advice": [
+            r"advice", r"recommendation", r"suggestion", r"tip",
+            r"guidance", r"insight", r"lesson", r"wisdom"
+        ]
+    }
+
+    # Process each content item
+    for item in content:
+        text = ""
+        if "text" in item:
+            text = item["text"]
+        elif "snippet" in item:
+            text = item["snippet"]
+        elif "title" in item:
+            text = item["title"]
+
+        if not text:
+            continue
+
+        # Extract sentences containing relevant patterns
+        sentences = re.split(r'[.!?]+', text)
+        for sentence in sentences:
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+
+            # Check each category's patterns
+            for category, category_patterns in patterns.items():
+                for pattern in category_patterns:
+                    if re.search(pattern, sentence.lower()):
+                        # Clean and format the sentence
+                        cleaned_sentence = re.sub(r'\s+', ' ', sentence).strip()
+                        if cleaned_sentence and len(cleaned_sentence) > 10:  # Avoid very short matches
+                            if cleaned_sentence not in analysis[category]:
+                                analysis[category].append(cleaned_sentence)
+
+    # Remove duplicates and sort
+    for category in analysis:
+        analysis[category] = sorted(list(set(analysis[category])))
+
+    # If any category is empty, add a default message
+    for category in analysis:
+        if not analysis[category]:
+            analysis[category].append(f"No specific {category} identified in the content.")
+
+    return analysis
@@ -0,0 +1,292 @@
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.fake_ollama import FakeOllamaServer
+from core.archive import TranscriptArchive
+from utils.config import settings
+
+console = Console()
+
+WORDS = (
+    "architecture latency product roadmap customer export analytics pipeline security "
+    "scalability budget onboarding retention dashboard migration database cache queue "
+    "api contract release feedback experiment metric revenue support compliance"
+).split()
+
+# Metrics where a larger value is an improvement; everything else is a cost
+HIGHER_IS_BETTER = ("per_sec", "speedup")
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def _timings(samples: List[float]) -> Dict[str, float]:
+    """Summarize a list of durations in seconds as milliseconds."""
+    return {
+        "p50_ms": _percentile(samples, 50) * 1000,
+        "p95_ms": _percentile(samples, 95) * 1000,
+        "mean_ms": statistics.mean(samples) * 1000,
+    }
+
+def _synthetic_text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+def bench_collaboration(iterations: int, latency: float, token_rate: float) -> Dict:
+    """Measure end-to-end collaboration throughput and per-turn overhead against a fake LLM."""
+    import main as cli
+
+    cli.console.quiet = True
+    results = {}
+    # Unthrottled server isolates orchestration overhead, the throttled one models a real model
+    for label, server_latency, server_rate in (("overhead", 0.0, 0.0), ("throughput", latency, token_rate)):
+        with FakeOllamaServer(latency=server_latency, token_rate=server_rate) as server, tempfile.TemporaryDirectory() as checkpoints:
+            settings.OLLAMA_API_URL = server.url
+            archive = TranscriptArchive(Path(checkpoints) / "archive")
+            collaboration = cli.AgentCollaboration(checkpoint_dir=Path(checkpoints), archive=archive)
+            collaboration.max_iterations = iterations
+
+            turn_times: List[float] = []
+            for agent in (collaboration.product_owner, collaboration.cto):
+                agent.process_message = _timed(agent.process_message, turn_times)
+
+            started = time.perf_counter()
+            collaboration.start_collaboration("Design a data export feature for enterprise customers")
+            elapsed = time.perf_counter() - started
+            expected = server.expected_duration()
+
+        overhead = [turn - expected for turn in turn_times]
+        results[label] = {
+            "turns": len(turn_times),
+            "wall_s": elapsed,
+            "turns_per_sec": len(turn_times) / elapsed,
+            "server_time_per_turn_ms": expected * 1000,
+            "turn": _timings(turn_times),
+            "turn_overhead": _timings(overhead),
+        }
+    cli.console.quiet = False
+    return results
+
+def _timed(func: Callable, samples: List[float]) -> Callable:
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            samples.append(time.perf_counter() - started)
+    return wrapper
+
+def bench_kb_query(sizes: List[int], queries: int) -> Dict:
+    """Measure KnowledgeManager.query_knowledge latency for growing knowledge bases."""
+    from core.knowledge_base.knowledge_manager import Document, KnowledgeManager
+
+    rng = random.Random(42)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = KnowledgeManager("benchmark", base_path=Path(tmp))
+        for size in sizes:
+            manager.documents = {
+                f"doc_{i}": Document(
+                    content=_synthetic_text(rng, 60),
+                    source=f"doc_{i}.md",
+                    doc_type="markdown",
+                )
+                for i in range(size)
+            }
+            # Mix of single-word hits and multi-word misses
+            terms = [rng.choice(WORDS) if i % 2 else f"{rng.choice(WORDS)} {rng.choice(WORDS)} zebra" for i in range(queries)]
+            samples = []
+            for term in terms:
+                started = time.perf_counter()
+                manager.query_knowledge(term)
+                samples.append(time.perf_counter() - started)
+            results[str(size)] = _timings(samples)
+    return results
+
+def bench_ingestion(documents: int, words: int) -> Dict:
+    """Measure KnowledgeManager.load_document throughput and peak memory."""
+    from core.knowledge_base.knowledge_manager import KnowledgeManager
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = Path(tmp) / "sources"
+        source_dir.mkdir()
+        total_bytes = 0
+        for i in range(documents):
+            path = source_dir / f"doc_{i}.md"
+            path.write_text(f"# Document {i}\n\n{_synthetic_text(rng, words)}\n")
+            total_bytes += path.stat().st_size
+
+        manager = KnowledgeManager("benchmark", base_path=Path(tmp) / "kb")
+        tracemalloc.start()
+        started = time.perf_counter()
+        for path in sorted(source_dir.iterdir()):
+            manager.load_document(path, "markdown")
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "documents": documents,
+        "wall_s": elapsed,
+        "docs_per_sec": documents / elapsed,
+        "mb_per_sec": total_bytes / elapsed / 1024 / 1024,
+        "peak_memory_mb": peak / 1024 / 1024,
+    }
+
+def _synthetic_content(rng: random.Random, items: int, sentences: int) -> List[Dict]:
+    """Transcript-like items mixing analysis phrases, case, whitespace and repeated sentences."""
+    from content_analysis import ANALYSIS_PATTERNS
+
+    phrases = [p for ps in ANALYSIS_PATTERNS.values() for p in ps] + ["characteristic", "tips", "issues", "Character", "TONE"]
+    repeated = [_synthetic_text(rng, 12) + f" {rng.choice(phrases)}" for _ in range(50)]
+    content = []
+    for i in range(items):
+        parts = []
+        for _ in range(sentences):
+            if rng.random() < 0.1:
+                parts.append(rng.choice(repeated))
+                continue
+            words = _synthetic_text(rng, rng.randint(2, 20)).split()
+            for _ in range(rng.choice((0, 0, 1, 2))):
+                words.insert(rng.randint(0, len(words)), rng.choice(phrases).upper() if rng.random() < 0.1 else rng.choice(phrases))
+            parts.append(rng.choice((" ", "  ", "\n")).join(words) + rng.choice((".", "!", "?", "...", ". ")))
+        text = " ".join(parts)
+        field = "text" if i % 10 else rng.choice(("snippet", "title", "text"))
+        content.append({field: text if i % 50 else ""})
+    return content
+
+def bench_content_analysis(items: int, sentences: int, workers: int) -> Dict:
+    """Compare the compiled content matcher with the original per-pattern scan on a synthetic corpus."""
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "staging"))
+    from content_analysis import analyze_content
+    from benchmarks.reference_analysis import reference_analyze_content
+
+    content = _synthetic_content(random.Random(11), items, sentences)
+    timings = {}
+    outputs = {}
+    for label, run in (
+        ("reference", lambda: reference_analyze_content(content)),
+        ("compiled", lambda: analyze_content(content)),
+        ("parallel", lambda: analyze_content(content, workers=workers)),
+    ):
+        started = time.perf_counter()
+        outputs[label] = run()
+        timings[label] = time.perf_counter() - started
+
+    for label in ("compiled", "parallel"):
+        if outputs[label] != outputs["reference"]:
+            raise AssertionError(f"{label} content analysis output differs from the reference implementation")
+
+    return {
+        "items": items,
+        "sentences": items * sentences,
+        "reference_s": timings["reference"],
+        "compiled_s": timings["compiled"],
+        "parallel_s": timings["parallel"],
+        "compiled_sentences_per_sec": items * sentences / timings["compiled"],
+        "speedup": timings["reference"] / timings["compiled"],
+    }
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _flatten(results: Dict, prefix: str = "") -> Dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name))
+        elif isinstance(value, (int, float)):
+            flat[name] = value
+    return flat
+
+def compare(baseline: Dict, current: Dict, tolerance: float) -> List[str]:
+    """Print a comparison table and return the metrics that regressed beyond tolerance."""
+    old = _flatten(baseline["results"])
+    new = _flatten(current["results"])
+    table = Table(title=f"Benchmark comparison vs {baseline.get('commit') or 'baseline'}")
+    for column in ("metric", "baseline", "current", "change"):
+        table.add_column(column)
+
+    regressions = []
+    for metric in sorted(old.keys() & new.keys()):
+        before, after = old[metric], new[metric]
+        # Sizes, and the unoptimized reference timing, describe the run rather than the code under test
+        if not before or metric.endswith(("turns", "documents", "server_time_per_turn_ms", "reference_s")):
+            continue
+        change = (after - before) / abs(before)
+        worse = -change if any(token in metric for token in HIGHER_IS_BETTER) else change
+        style = "red" if worse > tolerance else "green" if worse < -tolerance else ""
+        if worse > tolerance:
+            regressions.append(metric)
+        table.add_row(metric, f"{before:.3f}", f"{after:.3f}", f"[{style}]{change:+.1%}[/{style}]" if style else f"{change:+.1%}")
+    console.print(table)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark orchestration, knowledge base and ingestion performance")
+    parser.add_argument("--output", default="benchmarks/results/latest.json", help="Where to write the JSON results")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression before failing")
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes for a fast smoke run")
+    parser.add_argument("--iterations", type=int, default=10, help="Collaboration turns per run")
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake LLM time to first token in seconds")
+    parser.add_argument("--workers", type=int, default=4, help="Processes for the parallel content analysis run")
+    parser.add_argument("--token-rate", type=float, default=500.0, help="Fake LLM tokens per second")
+    args = parser.parse_args()
+
+    sizes = [1_000, 10_000] if args.quick else [1_000, 10_000, 100_000]
+    queries = 20 if args.quick else 50
+    documents = 200 if args.quick else 2_000
+
+    console.print("[bold]Running collaboration benchmark[/bold]")
+    results = {"collaboration": bench_collaboration(args.iterations, args.latency, args.token_rate)}
+    console.print("[bold]Running knowledge base query benchmark[/bold]")
+    results["kb_query"] = bench_kb_query(sizes, queries)
+    console.print("[bold]Running ingestion benchmark[/bold]")
+    results["ingestion"] = bench_ingestion(documents, words=400)
+    console.print("[bold]Running content analysis benchmark[/bold]")
+    results["content_analysis"] = bench_content_analysis(items=100 if args.quick else 300, sentences=60, workers=args.workers)
+
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "args": vars(args),
+        "results": results,
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    console.print(f"Results written to {output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(baseline, report, args.tolerance)
+        if regressions:
+            console.print(f"[red]Regressions beyond {args.tolerance:.0%}: {', '.join(regressions)}[/red]")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+import atexit
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+# Columns a turn can be grouped by and measured on in latency_stats()
+GROUP_COLUMNS = ("agent", "from_agent", "model", "session_id", "date")
+METRIC_COLUMNS = ("latency_s", "llm_s", "retrieval_s", "prompt_tokens", "response_tokens", "attempts")
+
+# Rough English average; good enough to compare runs, not to bill them
+CHARS_PER_TOKEN = 4
+
+def _schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("session_id", pa.string()),
+        ("timestamp", pa.timestamp("ms", tz="UTC")),
+        ("iteration", pa.int32()),
+        ("agent", pa.string()),
+        ("from_agent", pa.string()),
+        ("model", pa.string()),
+        ("prompt", pa.string()),
+        ("response", pa.string()),
+        ("prompt_tokens", pa.int32()),
+        ("response_tokens", pa.int32()),
+        ("latency_s", pa.float64()),
+        ("llm_s", pa.float64()),
+        ("retrieval_s", pa.float64()),
+        ("attempts", pa.int32()),
+        ("retrieved", pa.list_(pa.string())),
+    ])
+
+def _partitioning():
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    # ISO dates compare correctly as strings, which keeps date filters cheap
+    return ds.partitioning(pa.schema([("date", pa.string())]), flavor="hive")
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Approximate token count of a text."""
+    return -(-len(text or "") // CHARS_PER_TOKEN)
+
+def turn_record(session_id: str, turn: Dict[str, Any], model: Optional[str] = None) -> Dict[str, Any]:
+    """Flatten a checkpointed collaboration turn into an archive row.
+
+    Args:
+        session_id: Collaboration (checkpoint) session id
+        turn: Turn as recorded by SessionCheckpoint.record_turn
+        model: Model that produced the response
+    """
+    return {
+        "session_id": session_id,
+        "timestamp": datetime.fromtimestamp(turn.get("timestamp", time.time()), timezone.utc),
+        "iteration": turn["iteration"],
+        "agent": turn["agent"],
+        "from_agent": turn.get("from_agent"),
+        "model": model,
+        "prompt": turn["prompt"],
+        "response": turn["response"],
+        "prompt_tokens": estimate_tokens(turn["prompt"]),
+        "response_tokens": estimate_tokens(turn["response"]),
+        "latency_s": turn.get("duration_s"),
+        "llm_s": turn.get("llm_s"),
+        "retrieval_s": turn.get("retrieval_s"),
+        "attempts": turn.get("attempts"),
+        "retrieved": list(turn.get("retrieved") or []),
+    }
+
+class TranscriptArchive:
+    """Columnar archive of every collaboration turn, partitioned by day.
+
+    Turns are buffered in memory and written as one Parquet file per day
+    partition (``<root>/date=YYYY-MM-DD/part-*.parquet``) once ``batch_size``
+    turns are pending, ``flush_interval`` seconds after the first pending
+    turn arrived (checked by a background thread), or on ``flush``/``close``.
+    Files are written under a hidden name and renamed into place, so readers
+    never see a partial file. Safe to share between threads.
+    """
+
+    def __init__(self, root: Union[str, Path], batch_size: int = 256, flush_interval: float = 60.0):
+        """Open an archive.
+
+        Args:
+            root: Archive directory
+            batch_size: Pending turns that trigger a write
+            flush_interval: Seconds a turn may stay pending before it is written
+        """
+        self.root = Path(root)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._pending: List[Dict[str, Any]] = []
+        self._oldest_pending: Optional[float] = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Queue a turn record (see turn_record), writing the batch when it is full."""
+        with self._lock:
+            if not self._pending:
+                self._oldest_pending = time.monotonic()
+            self._pending.append(record)
+            due = len(self._pending) >= self.batch_size
+            if self._flusher is None and self.flush_interval > 0:
+                self._flusher = threading.Thread(target=self._flush_periodically, name="archive-flush", daemon=True)
+                self._flusher.start()
+        if due:
+            self.flush()
+
+    def _seconds_until_due(self) -> float:
+        with self._lock:
+            if not self._pending:
+                return self.flush_interval
+            return max(0.0, self._oldest_pending + self.flush_interval - time.monotonic())
+
+    def _flush_periodically(self) -> None:
+        """Write partial batches that have waited flush_interval, so idle processes do not hold turns"""
+        while not self._closed.wait(self._seconds_until_due()):
+            if self._seconds_until_due() > 0:
+                continue
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Failed to write archived turns, will retry: {e}")
+
+    def flush(self) -> List[Path]:
+        """Write all pending turns, returning the files created."""
+        with self._lock:
+            records, self._pending = self._pending, []
+            if not records:
+                return []
+            by_date: Dict[str, List[Dict[str, Any]]] = {}
+            for record in records:
+                by_date.setdefault(record["timestamp"].date().isoformat(), []).append(record)
+            days = sorted(by_date)
+            written = []
+            for index, day in enumerate(days):
+                try:
+                    written.append(self._write(day, by_date[day]))
+                except Exception:
+                    # Keep the turns of the days not yet written for the next attempt
+                    unwritten = [record for later in days[index:] for record in by_date[later]]
+                    self._pending = unwritten + self._pending
+                    self._oldest_pending = time.monotonic()
+                    raise
+            return written
+
+    def close(self) -> None:
+        """Stop the background flusher and write the remaining turns."""
+        self._closed.set()
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Failed to write {len(self._pending)} archived turns: {e}")
+
+    def _write(self, day: str, rows: List[Dict[str, Any]]) -> Path:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        directory = self.root / f"date={day}"
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f"part-{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}.parquet"
+        path, temporary = directory / name, directory / f".{name}.tmp"
+        pq.write_table(pa.Table.from_pylist(rows, schema=_schema()), temporary, compression="zstd")
+        os.replace(temporary, path)
+        logger.debug(f"Archived {len(rows)} turns to {path}")
+        return path
+
+def _date_filter(since: Optional[date], until: Optional[date]):
+    import pyarrow.dataset as ds
+
+    conditions = []
+    if since is not None:
+        conditions.append(ds.field("date") >= since.isoformat())
+    if until is not None:
+        conditions.append(ds.field("date") <= until.isoformat())
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+def _dataset(root: Union[str, Path]):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    root = Path(root)
+    if not root.exists():
+        raise FileNotFoundError(f"No transcript archive at {root}")
+    schema = _schema().append(pa.field("date", pa.string()))
+    return ds.dataset(root, format="parquet", partitioning=_partitioning(), schema=schema)
+
+def scan(root: Union[str, Path], columns: Optional[Sequence[str]] = None,
+         since: Optional[date] = None, until: Optional[date] = None):
+    """Read archived turns as an Arrow table.
+
+    Only the requested columns and the day partitions within [since, until]
+    are read from disk.
+
+    Args:
+        root: Archive directory
+        columns: Columns to read; all when omitted
+        since: First day to include
+        until: Last day to include
+    """
+    return _dataset(root).to_table(columns=list(columns) if columns else None, filter=_date_filter(since, until))
+
+def latency_stats(root: Union[str, Path], group_by: Sequence[str] = ("agent", "model"), metric: str = "latency_s",
+                  since: Optional[date] = None, until: Optional[date] = None) -> List[Dict[str, Any]]:
+    """Count, mean, p50, p95 and max of a per-turn metric for each group.
+
+    Percentiles come from a t-digest, so they are approximate on large archives.
+
+    Args:
+        root: Archive directory
+        group_by: Columns to group turns by (see GROUP_COLUMNS)
+        metric: Column to summarize (see METRIC_COLUMNS)
+        since: First day to include
+        until: Last day to include
+
+    Returns:
+        One dict per group, ordered by the group columns
+    """
+    import pyarrow.compute as pc
+
+    unknown = [column for column in group_by if column not in GROUP_COLUMNS]
+    if unknown:
+        raise ValueError(f"Cannot group by {', '.join(unknown)} (expected some of {', '.join(GROUP_COLUMNS)})")
+    if metric not in METRIC_COLUMNS:
+        raise ValueError(f"Unknown metric {metric} (expected one of {', '.join(METRIC_COLUMNS)})")
+
+    table = scan(root, columns=[*dict.fromkeys(group_by), metric], since=since, until=until)
+    table = table.filter(pc.is_valid(table[metric]))
+    grouped = table.group_by(list(group_by)).aggregate([
+        (metric, "count"),
+        (metric, "mean"),
+        (metric, "tdigest", pc.TDigestOptions(q=[0.5, 0.95])),
+        (metric, "max"),
+    ])
+    stats = []
+    for row in grouped.to_pylist():
+        p50, p95 = row[f"{metric}_tdigest"]
+        stats.append({
+            **{column: row[column] for column in group_by},
+            "turns": row[f"{metric}_count"],
+            "mean": row[f"{metric}_mean"],
+            "p50": p50,
+            "p95": p95,
+            "max": row[f"{metric}_max"],
+        })
+    return sorted(stats, key=lambda row: tuple(str(row[column]) for column in group_by))
+
+def compact(root: Union[str, Path], before: Optional[date] = None) -> int:
+    """Merge each finished day's batch files into a single file.
+
+    Days on or after ``before`` (today by default) are left alone, since
+    they may still be receiving writes.
+
+    Returns:
+        Number of day partitions compacted
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    before = (before or datetime.now(timezone.utc).date()).isoformat()
+    compacted = 0
+    for directory in sorted(Path(root).glob("date=*")):
+        files = sorted(directory.glob("part-*.parquet"))
+        if directory.name.split("=", 1)[1] >= before or len(files) < 2:
+            continue
+        table = pa.concat_tables(pq.read_table(path, schema=_schema()) for path in files)
+        name = f"part-{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}.parquet"
+        temporary = directory / f".{name}.tmp"
+        pq.write_table(table.sort_by("timestamp"), temporary, compression="zstd")
+        os.replace(temporary, directory / name)
+        for path in files:
+            path.unlink()
+        compacted += 1
+        logger.info(f"Compacted {len(files)} files ({table.num_rows} turns) in {directory}")
+    return compacted
+
+_default_archive: Optional[TranscriptArchive] = None
+_default_lock = threading.Lock()
+
+def default_archive() -> Optional[TranscriptArchive]:
+    """Process-wide archive configured by settings, flushed at exit; None when archiving is disabled."""
+    global _default_archive
+    from utils.config import settings
+
+    if not settings.ARCHIVE_ENABLED:
+        return None
+    with _default_lock:
+        if _default_archive is None:
+            _default_archive = TranscriptArchive(settings.ARCHIVE_DIR, settings.ARCHIVE_BATCH_SIZE,
+                                                 settings.ARCHIVE_FLUSH_INTERVAL)
+            atexit.register(_default_archive.close)
+        return _default_archive
@@ -0,0 +1,207 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("record", "replay")
+
+class CassetteMissError(KeyError):
+    """Raised in replay mode when a request has no recorded response."""
+
+class Cassette:
+    """Records LLM requests/responses to a JSON Lines file and replays them.
+
+    Each line holds one interaction: the model, the full prompt, the response
+    (or streamed chunks with their time offsets) and how long the call took.
+    Interactions are matched by model and prompt, so any change to prompt
+    assembly surfaces as a ``CassetteMissError`` during replay.
+    """
+
+    def __init__(self, path: Union[str, Path], mode: str = "replay", replay_timing: bool = False, timing_scale: float = 1.0):
+        """Open a cassette.
+
+        Args:
+            path: Cassette file (JSON Lines)
+            mode: 'record' to capture calls (truncates the file) or 'replay' to serve them
+            replay_timing: Sleep for the recorded durations when replaying
+            timing_scale: Multiplier applied to recorded durations when replay_timing is set
+        """
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode: {mode} (expected one of {', '.join(CASSETTE_MODES)})")
+        self.path = Path(path)
+        self.mode = mode
+        self.replay_timing = replay_timing
+        self.timing_scale = timing_scale
+        self._interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("")
+        else:
+            self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+        with open(self.path) as f:
+            for line in f:
+                if line.strip():
+                    interaction = json.loads(line)
+                    self._interactions.setdefault(interaction["key"], []).append(interaction)
+        logger.info(f"Loaded {sum(map(len, self._interactions.values()))} interactions from {self.path}")
+
+    @staticmethod
+    def request_key(model: Optional[str], prompt: str) -> str:
+        """Stable key identifying a request."""
+        return hashlib.sha256(f"{model}\x00{prompt}".encode()).hexdigest()
+
+    def append(self, interaction: Dict[str, Any]) -> None:
+        """Persist a recorded interaction."""
+        with self._lock:
+            self._interactions.setdefault(interaction["key"], []).append(interaction)
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(interaction) + "\n")
+
+    def lookup(self, model: Optional[str], prompt: str) -> Dict[str, Any]:
+        """Return the next recorded interaction for a request.
+
+        Identical requests are served in recording order; once exhausted the
+        last recording is repeated.
+        """
+        key = self.request_key(model, prompt)
+        with self._lock:
+            recorded = self._interactions.get(key)
+            if not recorded:
+                raise CassetteMissError(f"No recorded response for model {model!r} and prompt {prompt[:80]!r}... in {self.path}")
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            return recorded[min(index, len(recorded) - 1)]
+
+    def wait(self, seconds: float) -> None:
+        """Emulate recorded timing when enabled."""
+        if self.replay_timing and seconds > 0:
+            time.sleep(seconds * self.timing_scale)
+
+class CassetteLLM:
+    """Wraps an LLM so its calls are recorded to or replayed from a cassette.
+
+    Supports ``invoke`` and ``stream`` for both text LLMs and chat models and
+    can be composed into LangChain pipelines like the wrapped model.
+    """
+
+    def __init__(self, llm: Any, cassette: Cassette):
+        self.llm = llm
+        self.cassette = cassette
+        self.model = getattr(llm, "model", None) or getattr(llm, "model_name", None)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.llm, name)
+
+    def __call__(self, input: Any) -> Any:
+        return self.invoke(input)
+
+    def invoke(self, input: Any, config: Optional[Dict] = None, **kwargs) -> Any:
+        """Invoke the wrapped LLM or serve the recorded response."""
+        prompt = _prompt_text(input)
+        if self.cassette.mode == "replay":
+            interaction = self.cassette.lookup(self.model, prompt)
+            self.cassette.wait(interaction["duration"])
+            return _response(interaction["kind"], interaction["response"])
+
+        started = time.perf_counter()
+        result = self.llm.invoke(input, config, **kwargs)
+        self.cassette.append({
+            "key": self.cassette.request_key(self.model, prompt),
+            "model": self.model,
+            "prompt": prompt,
+            "kind": "message" if hasattr(result, "content") else "text",
+            "response": _text(result),
+            "chunks": None,
+            "duration": time.perf_counter() - started,
+        })
+        return result
+
+    def stream(self, input: Any, config: Optional[Dict] = None, **kwargs) -> Iterator[Any]:
+        """Stream from the wrapped LLM or replay the recorded chunks."""
+        prompt = _prompt_text(input)
+        if self.cassette.mode == "replay":
+            interaction = self.cassette.lookup(self.model, prompt)
+            chunks = interaction["chunks"] or [[interaction["duration"], interaction["response"]]]
+            previous = 0.0
+            for offset, text in chunks:
+                self.cassette.wait(offset - previous)
+                previous = offset
+                yield _response(interaction["kind"], text, chunk=True)
+            return
+
+        started = time.perf_counter()
+        chunks = []
+        kind = "text"
+        for chunk in self.llm.stream(input, config, **kwargs):
+            kind = "message" if hasattr(chunk, "content") else "text"
+            chunks.append([time.perf_counter() - started, _text(chunk)])
+            yield chunk
+        self.cassette.append({
+            "key": self.cassette.request_key(self.model, prompt),
+            "model": self.model,
+            "prompt": prompt,
+            "kind": kind,
+            "response": "".join(text for _, text in chunks),
+            "chunks": chunks,
+            "duration": time.perf_counter() - started,
+        })
+
+def _prompt_text(input: Any) -> str:
+    """Render LLM input (string, prompt value or message list) as text."""
+    if isinstance(input, str):
+        return input
+    if hasattr(input, "to_string"):
+        return input.to_string()
+    if isinstance(input, list):
+        return "\n".join(f"{getattr(m, 'type', 'message')}: {_text(m)}" for m in input)
+    return str(input)
+
+def _text(result: Any) -> str:
+    return result.content if hasattr(result, "content") else str(result)
+
+def _response(kind: str, text: str, chunk: bool = False) -> Any:
+    if kind != "message":
+        return text
+    from langchain_core.messages import AIMessage, AIMessageChunk
+    return AIMessageChunk(content=text) if chunk else AIMessage(content=text)
+
+_active_cassette: Optional[Cassette] = None
+
+def activate_cassette(path: Optional[Union[str, Path]], mode: str = "replay", replay_timing: bool = False) -> Optional[Cassette]:
+    """Make a cassette active for all LLMs created afterwards.
+
+    Args:
+        path: Cassette file, or None to deactivate
+        mode: 'record' or 'replay'
+        replay_timing: Emulate the recorded timing when replaying
+
+    Returns:
+        The active cassette, if any
+    """
+    global _active_cassette
+    _active_cassette = Cassette(path, mode, replay_timing) if path else None
+    return _active_cassette
+
+def active_cassette() -> Optional[Cassette]:
+    """Return the active cassette, opening the one configured in settings on first use."""
+    from utils.config import settings
+    if _active_cassette is None and settings.LLM_CASSETTE:
+        activate_cassette(settings.LLM_CASSETTE, settings.LLM_CASSETTE_MODE, settings.LLM_CASSETTE_REPLAY_TIMING)
+    return _active_cassette
+
+def wrap_llm(llm: Any) -> Any:
+    """Route an LLM through the active cassette, or return it unchanged."""
+    cassette = active_cassette()
+    return CassetteLLM(llm, cassette) if cassette else llm
@@ -0,0 +1,110 @@
+import json
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+def _repair_tail(path: Path, valid_end: int, terminated: bool) -> None:
+    """Drop a partially written last record so new records start on a line of their own."""
+    if path.stat().st_size > valid_end:
+        os.truncate(path, valid_end)
+    if not terminated:
+        with open(path, 'a') as f:
+            f.write("\n")
+
+class SessionCheckpoint:
+    """Durable, append-only record of a collaboration session's completed turns.
+
+    The checkpoint is a JSON Lines file: a ``session`` header followed by one
+    ``turn`` record per completed turn and an ``end`` record once the session
+    finishes. Every record is fsynced before the next LLM call starts, so a
+    crash loses at most the turn that was in flight.
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any], turns: Optional[List[Dict[str, Any]]] = None, completed: bool = False):
+        self.path = path
+        self.header = header
+        self.turns: List[Dict[str, Any]] = turns or []
+        self.completed = completed
+
+    @property
+    def session_id(self) -> str:
+        return self.header["session_id"]
+
+    @property
+    def initial_prompt(self) -> str:
+        return self.header["initial_prompt"]
+
+    @classmethod
+    def create(cls, directory: Path, initial_prompt: str, max_iterations: int, session_id: Optional[str] = None) -> "SessionCheckpoint":
+        """Start a new checkpoint file for a session.
+
+        Args:
+            directory: Directory holding session checkpoints
+            initial_prompt: The prompt the collaboration starts from
+            max_iterations: Iteration limit of the collaboration
+            session_id: Optional explicit session id, generated when omitted
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        header = {
+            "type": "session",
+            "session_id": session_id or uuid.uuid4().hex[:12],
+            "initial_prompt": initial_prompt,
+            "max_iterations": max_iterations,
+            "created_at": time.time(),
+        }
+        checkpoint = cls(directory / f"{header['session_id']}.jsonl", header)
+        if checkpoint.path.exists():
+            raise FileExistsError(f"Session checkpoint already exists: {checkpoint.path}")
+        checkpoint._append(header)
+        return checkpoint
+
+    @classmethod
+    def load(cls, directory: Path, session_id: str) -> "SessionCheckpoint":
+        """Load a session's checkpoint, ignoring a partially written last record."""
+        path = directory / f"{session_id}.jsonl"
+        if not path.exists():
+            raise FileNotFoundError(f"No checkpoint for session {session_id} in {directory}")
+
+        header, turns, completed = None, [], False
+        valid_end, terminated = 0, True
+        with open(path, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Discarding truncated record at {path}:{line_number}")
+                    break
+                valid_end += len(line)
+                terminated = line.endswith(b"\n")
+                if record["type"] == "session":
+                    header = record
+                elif record["type"] == "turn":
+                    turns.append(record)
+                elif record["type"] == "end":
+                    completed = True
+        if header is None:
+            raise ValueError(f"Checkpoint {path} has no session header")
+        _repair_tail(path, valid_end, terminated)
+        return cls(path, header, turns, completed)
+
+    def record_turn(self, turn: Dict[str, Any]) -> None:
+        """Durably append a completed turn."""
+        record = dict(turn, type="turn", timestamp=time.time())
+        self._append(record)
+        self.turns.append(record)
+
+    def complete(self, final_solution: Optional[str]) -> None:
+        """Mark the session as finished."""
+        self._append({"type": "end", "final_solution": final_solution, "timestamp": time.time()})
+        self.completed = True
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
@@ -0,0 +1,88 @@
+import http.client
+import json
+import socket
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+class AgentServerError(RuntimeError):
+    """Raised when the agent server returns an error response."""
+
+class AgentClient:
+    """Thin client for the agent server started with ``main.py serve``."""
+
+    def __init__(self, url: str, timeout: float = 3600.0):
+        """Initialize the client.
+
+        Args:
+            url: Server address, e.g. 'http://127.0.0.1:8765' or 'unix:///tmp/agents.sock'
+            timeout: Socket timeout in seconds; collaborations can take minutes
+        """
+        self.url = url
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        # Keep one persistent connection per thread
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            parsed = urlparse(self.url)
+            if parsed.scheme == "unix":
+                connection = _UnixHTTPConnection(parsed.path, self.timeout)
+            else:
+                connection = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=self.timeout)
+            self._local.connection = connection
+        return connection
+
+    def request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a request and return the decoded JSON response."""
+        body = json.dumps(payload).encode() if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body else {}
+        connection = self._connection()
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server dropped an idle keep-alive connection; retry once on a fresh one
+            connection.close()
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+        data = json.loads(response.read() or b"{}")
+        if response.status >= 400:
+            raise AgentServerError(f"{method} {path} failed with {response.status}: {data.get('error')}")
+        return data
+
+    def health(self) -> Dict[str, Any]:
+        return self.request("GET", "/health")
+
+    def create_session(self, max_iterations: Optional[int] = None) -> str:
+        return self.request("POST", "/sessions", {"max_iterations": max_iterations})["session_id"]
+
+    def get_session(self, session_id: str) -> Dict[str, Any]:
+        return self.request("GET", f"/sessions/{session_id}")
+
+    def close_session(self, session_id: str) -> None:
+        self.request("DELETE", f"/sessions/{session_id}")
+
+    def collaborate(self, prompt: Optional[str] = None, session_id: Optional[str] = None,
+                    max_iterations: Optional[int] = None, resume: Optional[str] = None) -> Dict[str, Any]:
+        """Run a collaboration on the server, in an existing session or a new one.
+
+        Pass ``resume`` (a checkpoint id from the server's checkpoint directory)
+        instead of a prompt to continue a collaboration after its last completed turn.
+        """
+        if session_id:
+            return self.request("POST", f"/sessions/{session_id}/collaborate", {"prompt": prompt, "resume": resume})
+        return self.request("POST", "/collaborate", {"prompt": prompt, "resume": resume, "max_iterations": max_iterations})
@@ -3,8 +3,7 @@ from typing import Dict, List, Optional, Union
 import json
 import logging
 from pydantic import BaseModel, Field
-from PyPDF2 import PdfReader
-import pandas as pd
+from core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +14,14 @@ class Document(BaseModel):
     source: str
     doc_type: str
 
+# Document type used for each file suffix when loading a whole directory
+DOC_TYPES = {
+    ".pdf": "pdf",
+    ".md": "markdown",
+    ".csv": "spreadsheet",
+    ".xlsx": "spreadsheet",
+}
+
 class KnowledgeManager:
     """Manages the knowledge base for an agent."""
     
@@ -36,6 +43,7 @@ class KnowledgeManager:
         (self.base_path / "documents").mkdir(exist_ok=True)
         (self.base_path / "processed").mkdir(exist_ok=True)
         
+    @traced(category="knowledge_base")
     def load_document(self, file_path: Union[str, Path], doc_type: str = "text") -> Document:
         """Load a document into the knowledge base.
         
@@ -80,8 +88,21 @@ class KnowledgeManager:
             logger.error(f"Error loading document {file_path}: {str(e)}")
             raise
             
+    def load_documents(self) -> List[Document]:
+        """Load every file in the knowledge base's documents directory.
+        
+        Returns:
+            List of loaded Document objects
+        """
+        return [
+            self.load_document(path, DOC_TYPES.get(path.suffix.lower(), "text"))
+            for path in sorted((self.base_path / "documents").iterdir())
+            if path.is_file()
+        ]
+            
     def _process_pdf(self, file_path: Path) -> str:
         """Process a PDF file and extract its text content."""
+        from PyPDF2 import PdfReader
         reader = PdfReader(file_path)
         text = ""
         for page in reader.pages:
@@ -90,6 +111,7 @@ class KnowledgeManager:
         
     def _process_spreadsheet(self, file_path: Path) -> str:
         """Process a spreadsheet file and convert it to text."""
+        import pandas as pd
         df = pd.read_excel(file_path) if file_path.suffix == '.xlsx' else pd.read_csv(file_path)
         return df.to_string()
         
@@ -107,6 +129,7 @@ class KnowledgeManager:
         with open(processed_path, 'w') as f:
             json.dump(document.model_dump(), f, indent=2)
             
+    @traced(category="knowledge_base")
     def query_knowledge(self, query: str) -> List[Document]:
         """Query the knowledge base for relevant documents.
         
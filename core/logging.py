@@ -4,6 +4,7 @@ from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.text import Text
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 from utils.config import settings
 
@@ -50,6 +51,7 @@ class AgentLogger:
         console.print(panel)
         self.logger.info(f"Operation {operation}: {details}")
 
-# Create loggers for both agents
-product_owner_logger = AgentLogger("Product Owner")
-cto_logger = AgentLogger("CTO") 
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_agent_logger(agent_name: str) -> AgentLogger:
+    """Return the logger for an agent, creating it (and its handler) on first use."""
+    return AgentLogger(agent_name) 
\ No newline at end of file
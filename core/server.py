@@ -0,0 +1,223 @@
+import json
+import logging
+import os
+import socketserver
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+class Session:
+    """A collaboration session hosted by the agent server."""
+
+    def __init__(self, session_id: str, collaboration: Any):
+        self.session_id = session_id
+        self.collaboration = collaboration
+        self.history: List[Dict[str, Any]] = []
+        self.created_at = time.time()
+        self.lock = threading.Lock()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "created_at": self.created_at,
+            "max_iterations": self.collaboration.max_iterations,
+            "history": self.history,
+        }
+
+class AgentServer:
+    """Long-running process that serves collaborations from warm agents.
+
+    Agents, their knowledge bases and LLM clients (with their pooled HTTP
+    connections) are created once by the caller and shared by every session,
+    so a request only pays for the LLM calls themselves.
+    """
+
+    def __init__(self, collaboration_factory: Callable[[], Any]):
+        """Initialize the server.
+
+        Args:
+            collaboration_factory: Returns a new AgentCollaboration bound to the shared agents
+        """
+        self.collaboration_factory = collaboration_factory
+        self.sessions: Dict[str, Session] = {}
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    def create_session(self, max_iterations: Optional[int] = None) -> Session:
+        """Create a new session with its own collaboration state."""
+        collaboration = self.collaboration_factory()
+        if max_iterations:
+            collaboration.max_iterations = max_iterations
+        session = Session(uuid.uuid4().hex[:12], collaboration)
+        with self._lock:
+            self.sessions[session.session_id] = session
+        return session
+
+    def get_session(self, session_id: str) -> Session:
+        with self._lock:
+            if session_id not in self.sessions:
+                raise KeyError(session_id)
+            return self.sessions[session_id]
+
+    def close_session(self, session_id: str) -> None:
+        with self._lock:
+            self.sessions.pop(session_id, None)
+
+    def collaborate(self, session: Session, prompt: Optional[str] = None, resume: Optional[str] = None) -> Dict[str, Any]:
+        """Run a collaboration within a session; requests to one session are serialized.
+
+        Args:
+            session: Session to run in
+            prompt: Prompt of a new collaboration
+            resume: Checkpoint id of a collaboration to continue after its last completed turn
+        """
+        with session.lock:
+            started = time.perf_counter()
+            if resume:
+                result = session.collaboration.resume_collaboration(resume)
+                prompt = session.collaboration.checkpoint.initial_prompt
+            else:
+                result = session.collaboration.start_collaboration(prompt)
+            # The collaboration's own id names its checkpoint; session_id is the server session
+            result = dict(result, checkpoint_id=result["session_id"], session_id=session.session_id,
+                          prompt=prompt, elapsed_s=time.perf_counter() - started)
+            session.history.append(result)
+        return result
+
+    def health(self) -> Dict[str, Any]:
+        return {"status": "ok", "sessions": len(self.sessions), "uptime_s": time.time() - self.started_at}
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8765, socket_path: Optional[Union[str, Path]] = None) -> None:
+        """Serve the HTTP API until interrupted.
+
+        Args:
+            host: Interface to bind when serving over TCP
+            port: Port to bind when serving over TCP
+            socket_path: Serve on this Unix socket instead of TCP
+        """
+        httpd = self.make_httpd(host, port, socket_path)
+        logger.info(f"Agent server listening on {describe_address(httpd, socket_path)}")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            httpd.server_close()
+            if socket_path:
+                Path(socket_path).unlink(missing_ok=True)
+
+    def make_httpd(self, host: str = "127.0.0.1", port: int = 8765, socket_path: Optional[Union[str, Path]] = None) -> socketserver.BaseServer:
+        """Create (but do not start) the HTTP server for this agent server."""
+        handler = _make_handler(self)
+        if socket_path:
+            socket_path = str(socket_path)
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            return _ThreadingUnixHTTPServer(socket_path, handler)
+        httpd = ThreadingHTTPServer((host, port), handler)
+        httpd.daemon_threads = True
+        return httpd
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+def describe_address(httpd: socketserver.BaseServer, socket_path: Optional[Union[str, Path]] = None) -> str:
+    """Client URL for a running server."""
+    if socket_path:
+        return f"unix://{socket_path}"
+    host, port = httpd.server_address[:2]
+    return f"http://{host}:{port}"
+
+def _make_handler(server: AgentServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def address_string(self) -> str:
+            # Unix socket peers have no address
+            return self.client_address[0] if self.client_address else "unix"
+
+        def log_message(self, format, *args):
+            logger.debug(f"{self.address_string()} {format % args}")
+
+        def do_GET(self):
+            parts = self._parts()
+            if parts == ["health"]:
+                self._send(200, server.health())
+            elif len(parts) == 2 and parts[0] == "sessions":
+                self._with_session(parts[1], lambda session: self._send(200, session.to_dict()))
+            else:
+                self._send(404, {"error": f"Unknown path {self.path}"})
+
+        def do_POST(self):
+            parts = self._parts()
+            try:
+                body = self._body()
+            except ValueError as e:
+                self._send(400, {"error": f"Invalid JSON body: {e}"})
+                return
+
+            if parts == ["sessions"]:
+                session = server.create_session(body.get("max_iterations"))
+                self._send(201, {"session_id": session.session_id})
+            elif parts == ["collaborate"]:
+                # One-shot collaboration in a fresh session
+                if not (body.get("prompt") or body.get("resume")):
+                    self._send(400, {"error": "'prompt' or 'resume' is required"})
+                    return
+                session = server.create_session(body.get("max_iterations"))
+                self._collaborate(session, body)
+            elif len(parts) == 3 and parts[0] == "sessions" and parts[2] == "collaborate":
+                if not (body.get("prompt") or body.get("resume")):
+                    self._send(400, {"error": "'prompt' or 'resume' is required"})
+                    return
+                self._with_session(parts[1], lambda session: self._collaborate(session, body))
+            else:
+                self._send(404, {"error": f"Unknown path {self.path}"})
+
+        def do_DELETE(self):
+            parts = self._parts()
+            if len(parts) == 2 and parts[0] == "sessions":
+                server.close_session(parts[1])
+                self._send(200, {"session_id": parts[1], "closed": True})
+            else:
+                self._send(404, {"error": f"Unknown path {self.path}"})
+
+        def _collaborate(self, session: Session, body: Dict[str, Any]) -> None:
+            try:
+                self._send(200, server.collaborate(session, body.get("prompt"), body.get("resume")))
+            except FileNotFoundError as e:
+                # No checkpoint with the id to resume
+                self._send(404, {"error": str(e), "session_id": session.session_id})
+            except Exception as e:
+                logger.exception(f"Collaboration failed in session {session.session_id}")
+                self._send(500, {"error": str(e), "session_id": session.session_id})
+
+        def _with_session(self, session_id: str, action: Callable[[Session], None]) -> None:
+            try:
+                session = server.get_session(session_id)
+            except KeyError:
+                self._send(404, {"error": f"Unknown session {session_id}"})
+                return
+            action(session)
+
+        def _parts(self) -> List[str]:
+            return [part for part in self.path.split("?")[0].split("/") if part]
+
+        def _body(self) -> Dict[str, Any]:
+            length = int(self.headers.get("Content-Length", 0))
+            return json.loads(self.rfile.read(length)) if length else {}
+
+        def _send(self, status: int, payload: Dict[str, Any]) -> None:
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
@@ -0,0 +1,205 @@
+import cProfile
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+class Tracer:
+    """Records nested timing spans and exports them as Chrome trace events."""
+
+    def __init__(self, enabled: bool = False):
+        """Initialize the tracer.
+
+        Args:
+            enabled: Whether spans are recorded; disabled spans cost a single branch
+        """
+        self.enabled = enabled
+        self._events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def enable(self) -> None:
+        """Start recording spans."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording spans."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Drop all recorded spans and restart the trace clock."""
+        with self._lock:
+            self._events = []
+            self._thread_names = {}
+            self._origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, category: str = "app", **args: Any) -> Iterator[Dict[str, Any]]:
+        """Record the enclosed block as a span.
+
+        Spans opened inside another span on the same thread are nested by the
+        trace viewer based on their timestamps.
+
+        Args:
+            name: Span name shown in the viewer
+            category: Span category used for filtering in the viewer
+            **args: Extra key/value pairs attached to the span
+
+        Yields:
+            The span's argument dict, which the block may extend with results
+        """
+        if not self.enabled:
+            yield args
+            return
+
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            end = time.perf_counter()
+            thread = threading.current_thread()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": thread.ident,
+                "args": {key: _jsonable(value) for key, value in args.items()},
+            }
+            with self._lock:
+                self._events.append(event)
+                self._thread_names.setdefault(thread.ident, thread.name)
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Return the recorded events, including thread name metadata."""
+        pid = os.getpid()
+        with self._lock:
+            metadata = [
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                for tid, name in self._thread_names.items()
+            ]
+            return metadata + list(self._events)
+
+    def export_chrome_trace(self, path: Union[str, Path]) -> Path:
+        """Write the recorded spans as Chrome trace-event JSON.
+
+        The file can be opened in Perfetto (ui.perfetto.dev) or chrome://tracing.
+
+        Args:
+            path: Destination file
+
+        Returns:
+            Path of the written trace
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({"traceEvents": self.events(), "displayTimeUnit": "ms"}, f)
+        logger.info(f"Wrote {len(self._events)} trace spans to {path}")
+        return path
+
+def _jsonable(value: Any) -> Any:
+    """Coerce span arguments into JSON-serializable values."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+# Process-wide tracer shared by the agents, knowledge base and scraper
+tracer = Tracer()
+
+def traced(name: Optional[str] = None, category: str = "app") -> Callable:
+    """Decorator that records each call of the wrapped function as a span.
+
+    Args:
+        name: Span name, defaults to the function's qualified name
+        category: Span category
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+@contextmanager
+def capture_profile(output_prefix: Union[str, Path], top: int = 15) -> Iterator[None]:
+    """Capture a cProfile profile and a tracemalloc snapshot of the enclosed block.
+
+    Writes ``<prefix>.prof`` (open with ``python -m pstats`` or snakeviz) and
+    ``<prefix>.tracemalloc`` (load with ``tracemalloc.Snapshot.load``).
+
+    cProfile only sees the calling thread: work done on worker threads, such
+    as the scraper's pipeline stages, shows up as time spent waiting on them.
+    The memory snapshot covers every thread, and the Chrome trace written by
+    ``trace_session`` shows per-thread spans for the threaded stages.
+
+    Args:
+        output_prefix: Path prefix for the output files
+        top: Number of top allocation sites to log
+    """
+    output_prefix = Path(output_prefix)
+    output_prefix.parent.mkdir(parents=True, exist_ok=True)
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if started_tracemalloc:
+            tracemalloc.stop()
+
+        profile_path = output_prefix.with_suffix(".prof")
+        snapshot_path = output_prefix.with_suffix(".tracemalloc")
+        profiler.dump_stats(str(profile_path))
+        snapshot.dump(str(snapshot_path))
+
+        logger.info(f"Peak traced memory: {peak / 1024 / 1024:.1f} MiB")
+        for stat in snapshot.statistics("lineno")[:top]:
+            logger.info(f"Allocation: {stat}")
+        logger.info(f"Wrote profile to {profile_path} and memory snapshot to {snapshot_path}")
+
+@contextmanager
+def trace_session(trace_path: Optional[Union[str, Path]], profile: bool = False) -> Iterator[None]:
+    """Enable tracing (and optionally profiling) for the enclosed block.
+
+    Args:
+        trace_path: Where to write the Chrome trace; tracing is skipped when None
+        profile: Also capture cProfile and tracemalloc output next to the trace
+    """
+    if trace_path is None:
+        yield
+        return
+
+    trace_path = Path(trace_path)
+    tracer.reset()
+    tracer.enable()
+    try:
+        if profile:
+            with capture_profile(trace_path.with_suffix("")):
+                yield
+        else:
+            yield
+    finally:
+        tracer.disable()
+        tracer.export_chrome_trace(trace_path)
@@ -1,37 +1,127 @@
+import time
 import typer
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from rich.console import Console
+from rich.panel import Panel
 from rich.prompt import Prompt
-from agents.product_owner.agent import ProductOwnerAgent
-from agents.cto.agent import CTOAgent
-from utils.config import settings
+from rich.table import Table
+from core.tracing import tracer, trace_session
+from core.cassette import activate_cassette
 
 app = typer.Typer()
+archive_app = typer.Typer(help="Query the columnar archive of collaboration turns.")
+app.add_typer(archive_app, name="archive")
 console = Console()
 
+def create_agents(with_knowledge: bool = False):
+    """Create the Product Owner and CTO agents, optionally with their knowledge bases loaded."""
+    # Imported here so that CLI startup does not pay for LangChain
+    from agents.product_owner.agent import ProductOwnerAgent
+    from agents.cto.agent import CTOAgent
+
+    po_knowledge = cto_knowledge = None
+    if with_knowledge:
+        from core.knowledge_base.knowledge_manager import KnowledgeManager
+        from utils.config import settings
+        po_knowledge = KnowledgeManager("product_owner", settings.PRODUCT_OWNER_KB)
+        cto_knowledge = KnowledgeManager("cto", settings.CTO_KB)
+        po_knowledge.load_documents()
+        cto_knowledge.load_documents()
+    return ProductOwnerAgent(knowledge_manager=po_knowledge), CTOAgent(knowledge_manager=cto_knowledge)
+
 class AgentCollaboration:
-    def __init__(self):
-        self.product_owner = ProductOwnerAgent()
-        self.cto = CTOAgent()
+    def __init__(self, product_owner=None, cto=None, checkpoint_dir: Optional[Path] = None, archive=None):
+        from core.archive import default_archive
+        from utils.config import settings
+
+        if product_owner is None or cto is None:
+            product_owner, cto = create_agents()
+        self.product_owner = product_owner
+        self.cto = cto
         self.max_iterations = 10  # Prevent infinite loops
+        self.checkpoint_dir = checkpoint_dir or settings.CHECKPOINT_DIR
+        self.max_retries = settings.TURN_MAX_RETRIES
+        self.retry_backoff = settings.TURN_RETRY_BACKOFF
+        self.checkpoint = None
+        # Every turn also goes to the columnar archive (core/archive.py)
+        self.archive = archive if archive is not None else default_archive()
     
-    def start_collaboration(self, initial_prompt: str):
+    def start_collaboration(self, initial_prompt: str) -> Dict[str, Any]:
+        """Run a new collaboration and return its turns and final solution (if one was reached)"""
+        from core.checkpoint import SessionCheckpoint
+
+        self.checkpoint = SessionCheckpoint.create(self.checkpoint_dir, initial_prompt, self.max_iterations)
         console.print("\n[bold green]Starting Agent Collaboration[/bold green]")
+        console.print(f"[bold]Session:[/bold] {self.checkpoint.session_id}")
         console.print(f"[bold]Initial Prompt:[/bold] {initial_prompt}\n")
+        return self._run()
+    
+    def resume_collaboration(self, session_id: str) -> Dict[str, Any]:
+        """Continue a checkpointed collaboration after its last completed turn"""
+        from core.checkpoint import SessionCheckpoint
+
+        self.checkpoint = SessionCheckpoint.load(self.checkpoint_dir, session_id)
+        self.max_iterations = self.checkpoint.header["max_iterations"]
+        console.print(f"\n[bold green]Resuming Agent Collaboration[/bold green] {session_id} "
+                      f"after {len(self.checkpoint.turns)} completed turns")
+        console.print(f"[bold]Initial Prompt:[/bold] {self.checkpoint.initial_prompt}\n")
+        return self._run()
+    
+    def _run(self) -> Dict[str, Any]:
+        checkpoint = self.checkpoint
+        agents = {agent.name: agent for agent in (self.product_owner, self.cto)}
+        turns = list(checkpoint.turns)
         
-        # Start with Product Owner's perspective
-        current_agent = self.product_owner
-        other_agent = self.cto
-        message = initial_prompt
-        iteration = 0
+        if turns:
+            # Pick up where the last completed turn left off
+            state = turns[-1]["state"]
+            current_agent = agents[state["current_agent"]]
+            other_agent = agents[state["other_agent"]]
+            message = turns[-1]["response"]
+            iteration = turns[-1]["iteration"] + 1
+            final_solution = turns[-1]["response"] if self._is_conclusion(turns[-1]["response"]) else None
+        else:
+            # Start with Product Owner's perspective
+            current_agent = self.product_owner
+            other_agent = self.cto
+            message = checkpoint.initial_prompt
+            iteration = 0
+            final_solution = None
         
-        while iteration < self.max_iterations:
+        while final_solution is None and iteration < self.max_iterations:
             # Get response from current agent
-            response = current_agent.process_message(message, from_agent=other_agent.name)
+            with tracer.span("turn", category="collaboration", iteration=iteration, agent=current_agent.name):
+                started = time.perf_counter()
+                relevant_docs = current_agent.retrieve(message)
+                retrieved = time.perf_counter()
+                response, attempts = self._respond_with_retry(current_agent, message, other_agent.name, relevant_docs)
+                finished = time.perf_counter()
+            
+            turn = {
+                "iteration": iteration,
+                "agent": current_agent.name,
+                "from_agent": other_agent.name,
+                "prompt": message,
+                "response": response,
+                "retrieved": [doc.source for doc in relevant_docs],
+                "attempts": attempts,
+                "duration_s": finished - started,
+                "retrieval_s": retrieved - started,
+                "llm_s": finished - retrieved,
+                # Who speaks next, so a resumed session continues with the right agent
+                "state": {"current_agent": other_agent.name, "other_agent": current_agent.name},
+            }
+            checkpoint.record_turn(turn)
+            turns.append(checkpoint.turns[-1])
+            if self.archive is not None:
+                from core.archive import turn_record
+                self.archive.append(turn_record(checkpoint.session_id, turns[-1], getattr(current_agent, "model", None)))
             
             # Check if we've reached a conclusion
             if self._is_conclusion(response):
-                console.print("\n[bold green]Collaboration Complete![/bold green]")
-                console.print(f"[bold]Final Solution:[/bold]\n{response}")
+                final_solution = response
                 break
             
             # Switch agents
@@ -39,8 +129,32 @@ class AgentCollaboration:
             message = response
             iteration += 1
         
-        if iteration >= self.max_iterations:
+        if final_solution is not None:
+            console.print("\n[bold green]Collaboration Complete![/bold green]")
+            console.print(f"[bold]Final Solution:[/bold]\n{final_solution}")
+        else:
             console.print("\n[bold yellow]Maximum iterations reached. Collaboration ended.[/bold yellow]")
+        
+        if not checkpoint.completed:
+            checkpoint.complete(final_solution)
+        return {"session_id": checkpoint.session_id, "turns": turns, "final_solution": final_solution}
+    
+    def _respond_with_retry(self, agent, message: str, from_agent: str, relevant_docs) -> Tuple[str, int]:
+        """Get an agent's response, retrying transient failures with exponential backoff"""
+        from core.cassette import CassetteMissError
+
+        for attempt in range(1, self.max_retries + 2):
+            try:
+                return agent.process_message(message, from_agent=from_agent, relevant_docs=relevant_docs), attempt
+            except CassetteMissError:
+                raise
+            except Exception as e:
+                if attempt > self.max_retries:
+                    raise
+                delay = self.retry_backoff * 2 ** (attempt - 1)
+                console.print(f"[yellow]{agent.name} failed ({e}); retrying in {delay:.1f}s "
+                              f"(retry {attempt}/{self.max_retries})[/yellow]")
+                time.sleep(delay)
     
     def _is_conclusion(self, response: str) -> bool:
         """Check if the response indicates a conclusion has been reached"""
@@ -56,11 +170,139 @@ class AgentCollaboration:
 
 @app.command()
 def collaborate(
-    prompt: str = typer.Option(..., prompt=True, help="The initial prompt for the agents to collaborate on")
+    prompt: Optional[str] = typer.Option(None, help="The initial prompt for the agents to collaborate on"),
+    resume: Optional[str] = typer.Option(None, help="Resume a checkpointed session after its last completed turn (with --server, one checkpointed by that server)"),
+    trace: Optional[Path] = typer.Option(None, help="Write a Chrome trace of the run to this file (view in Perfetto)"),
+    profile: bool = typer.Option(False, help="Also capture cProfile and tracemalloc output next to the trace"),
+    cassette: Optional[Path] = typer.Option(None, help="Record LLM calls to, or replay them from, this cassette file"),
+    cassette_mode: str = typer.Option("replay", help="Cassette mode: 'record' or 'replay'"),
+    replay_timing: bool = typer.Option(False, help="Emulate the recorded LLM timing when replaying"),
+    server: Optional[str] = typer.Option(None, help="Run on an agent server instead, e.g. http://127.0.0.1:8765 or unix:///tmp/agents.sock")
 ):
     """Start a collaboration between the Product Owner and CTO agents."""
-    collaboration = AgentCollaboration()
-    collaboration.start_collaboration(prompt)
+    if server:
+        # These act on this process, which does no agent work when a server runs the collaboration
+        local_only = {"--trace": trace is not None, "--profile": profile, "--cassette": cassette is not None,
+                      "--cassette-mode": cassette_mode != "replay", "--replay-timing": replay_timing}
+        rejected = [option for option, given in local_only.items() if given]
+        if rejected:
+            raise typer.BadParameter(f"{', '.join(rejected)} cannot be combined with --server; "
+                                     f"pass them to the local run instead", param_hint="--server")
+    if prompt is None and resume is None:
+        prompt = typer.prompt("Prompt")
+    if server:
+        _collaborate_remote(server, prompt, resume)
+        return
+    if cassette:
+        activate_cassette(cassette, cassette_mode, replay_timing)
+    if profile and trace is None:
+        trace = Path("trace.json")
+    with trace_session(trace, profile=profile):
+        with tracer.span("collaboration", category="collaboration"):
+            collaboration = AgentCollaboration()
+            try:
+                if resume:
+                    collaboration.resume_collaboration(resume)
+                else:
+                    collaboration.start_collaboration(prompt)
+            except Exception:
+                if collaboration.checkpoint:
+                    session_id = collaboration.checkpoint.session_id
+                    console.print(f"\n[bold red]Collaboration failed.[/bold red] Completed turns are checkpointed; "
+                                  f"continue with: [bold]python main.py collaborate --resume {session_id}[/bold]")
+                raise
+
+def _collaborate_remote(server: str, prompt: Optional[str], resume: Optional[str] = None) -> None:
+    """Run (or resume) a collaboration on a warm agent server and print the outcome."""
+    from core.client import AgentClient
+
+    if resume:
+        console.print(f"\n[bold green]Resuming Agent Collaboration[/bold green] {resume} [dim](server: {server})[/dim]")
+        result = AgentClient(server).collaborate(resume=resume)
+        console.print(f"[bold]Initial Prompt:[/bold] {result['prompt']}\n")
+    else:
+        console.print(f"\n[bold green]Starting Agent Collaboration[/bold green] [dim](server: {server})[/dim]")
+        console.print(f"[bold]Initial Prompt:[/bold] {prompt}\n")
+        result = AgentClient(server).collaborate(prompt)
+    for turn in result["turns"]:
+        console.print(Panel(turn["response"], title=f"[bold blue]{turn['agent']}[/bold blue]"))
+    if result["final_solution"]:
+        console.print("\n[bold green]Collaboration Complete![/bold green]")
+        console.print(f"[bold]Final Solution:[/bold]\n{result['final_solution']}")
+    else:
+        console.print("\n[bold yellow]Maximum iterations reached. Collaboration ended.[/bold yellow]")
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", help="Interface to bind"),
+    port: int = typer.Option(8765, help="Port to bind"),
+    socket: Optional[Path] = typer.Option(None, help="Serve on this Unix socket instead of TCP"),
+    knowledge: bool = typer.Option(True, help="Load the agents' knowledge bases at startup")
+):
+    """Run a long-lived agent server that keeps agents, knowledge bases and LLM connections warm."""
+    import logging
+    import signal
+    from core.archive import default_archive
+    from core.server import AgentServer
+
+    logging.basicConfig(level=logging.INFO)
+    product_owner, cto = create_agents(with_knowledge=knowledge)
+    # Build the LLM clients up front so the first request does not pay for them
+    _ = product_owner.llm, cto.llm
+    console.quiet = True
+
+    agent_server = AgentServer(lambda: AgentCollaboration(product_owner, cto))
+    # Stop on SIGTERM as on Ctrl-C, so the socket is removed and buffered turns are archived
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        agent_server.serve(host, port, socket)
+    finally:
+        archive = default_archive()
+        if archive is not None:
+            archive.close()
+
+@archive_app.command("stats")
+def archive_stats(
+    since: Optional[datetime] = typer.Option(None, formats=["%Y-%m-%d"], help="First day to include (YYYY-MM-DD)"),
+    until: Optional[datetime] = typer.Option(None, formats=["%Y-%m-%d"], help="Last day to include (YYYY-MM-DD)"),
+    by: List[str] = typer.Option(["agent", "model"], help="Column to group by; repeat for several"),
+    metric: str = typer.Option("latency_s", help="Per-turn value to summarize, e.g. latency_s, llm_s, retrieval_s, response_tokens"),
+    archive_dir: Optional[Path] = typer.Option(None, help="Archive directory (defaults to ARCHIVE_DIR)")
+):
+    """Show count, mean, p50, p95 and max of a turn metric per group."""
+    from core.archive import latency_stats
+    from utils.config import settings
+
+    archive_dir = archive_dir or settings.ARCHIVE_DIR
+    started = time.perf_counter()
+    try:
+        stats = latency_stats(archive_dir, by, metric, since and since.date(), until and until.date())
+    except (FileNotFoundError, ValueError) as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(1)
+    elapsed = time.perf_counter() - started
+
+    table = Table(title=f"{metric} by {', '.join(by)}")
+    for column in by:
+        table.add_column(column)
+    for column in ("turns", "mean", "p50", "p95", "max"):
+        table.add_column(column, justify="right")
+    for row in stats:
+        table.add_row(*(str(row[column]) for column in by), str(row["turns"]),
+                      *(f"{row[column]:.3f}" for column in ("mean", "p50", "p95", "max")))
+    console.print(table)
+    console.print(f"[dim]{sum(row['turns'] for row in stats)} turns scanned in {elapsed:.2f}s[/dim]")
+
+@archive_app.command("compact")
+def archive_compact(
+    archive_dir: Optional[Path] = typer.Option(None, help="Archive directory (defaults to ARCHIVE_DIR)")
+):
+    """Merge each finished day's batch files into one file to speed up scans."""
+    from core.archive import compact
+    from utils.config import settings
+
+    count = compact(archive_dir or settings.ARCHIVE_DIR)
+    console.print(f"Compacted {count} day partitions")
 
 if __name__ == "__main__":
     app() 
\ No newline at end of file
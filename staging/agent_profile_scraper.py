@@ -5,23 +5,41 @@ import requests
 from bs4 import BeautifulSoup
 from newspaper import Article
 import tweepy
-from youtube_transcript_api import YouTubeTranscriptApi
-import yt_dlp
 from datetime import datetime
 import logging
-from typing import Dict, List, Optional
-import re
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-from urllib.parse import quote_plus
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+import threading
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import nltk
+from browser_pool import get_browser_pool
+from content_analysis import AnalysisStore, ContentAnalyzer, item_text
+from dedup import NearDuplicateFilter
+from fetch_cache import DEFAULT_TTLS, FetchCache
+from fetcher import ArticleFetcher, RateLimiter
+from media import MediaStage, media_key
+from pipeline import Pipeline, Stage
+from profile_state import ProfileState
+from serp_parsers import SERP_PARSERS
+from transcription import get_transcription_service
+
+# Span tracer shared with the agent runtime; entry points such as run_scraper.py
+# put the repository root on sys.path
+from core.tracing import tracer, traced
+
+# Configure logging before anything logs: the first logging call would otherwise
+# set up the root logger at WARNING and hide every INFO line, run summaries included
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('scraping.log'),
+        logging.StreamHandler()
+    ]
+)
 
 # Download required NLTK data
 try:
@@ -37,54 +55,146 @@ except ImportError:
     WHISPER_AVAILABLE = False
     logging.warning("Whisper not available. Video transcription will be disabled falling back to youtube transcripts.")
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('scraping.log'),
-        logging.StreamHandler()
-    ]
-)
+# Engines queried for every search query, in result merge order
+SEARCH_ENGINES = ("google_news", "google", "youtube")
+
+# How results pages are loaded: "auto" (plain HTTP, with a browser only for
+# engines that need JavaScript or when HTTP yields nothing), "http" or "browser"
+SERP_FETCH_MODES = ("auto", "http", "browser")
+
+DEFAULT_CONFIG = {
+    "twitter_api_key": "",
+    "twitter_api_secret": "",
+    "twitter_access_token": "",
+    "twitter_access_token_secret": "",
+    "search_engines": ["google", "bing"],
+    "max_results": 50,
+    "video_download": True,
+    "transcribe_videos": True,
+    "browser_pool_size": 4,
+    "page_load_timeout": 30,
+    "search_wait_timeout": 10,
+    "fetch_workers": 8,
+    "fetch_per_host": 2,
+    "fetch_politeness_delay": 1.0,
+    "fetch_timeout": 15,
+    "fetch_retries": 3,
+    "fetch_cache": True,
+    "cache_ttls": DEFAULT_TTLS,
+    "local_transcription": False,
+    "whisper_model": "base",
+    "whisper_workers": 0,
+    "whisper_chunk_seconds": 30,
+    "audio_download_workers": 2,
+    "audio_ratelimit": 2000000,
+    "extract_workers": 2,
+    "pipeline_queue_size": 32,
+    "dedup_threshold": 0.8,
+    "dedup_num_perm": 128,
+    "global_rate_limit": 10.0,
+    "serp_fetch_mode": "auto"
+}
+
+# Shared by every profile: fetches are keyed by URL and audio by video ID
+RAW_DATA_DIR = Path("raw_data")
+HTTP_CACHE_DIR = RAW_DATA_DIR / "http_cache"
+AUDIO_DIR = RAW_DATA_DIR / "audio"
+WHISPER_CACHE_DIR = RAW_DATA_DIR / "whisper_cache"
+
+def load_config(config_path: str) -> Dict:
+    """Load configuration from JSON file, writing the defaults if it does not exist"""
+    try:
+        with open(config_path, 'r') as f:
+            # Options missing from older config files fall back to the defaults
+            return {**DEFAULT_CONFIG, **json.load(f)}
+    except FileNotFoundError:
+        config = dict(DEFAULT_CONFIG)
+        with open(config_path, 'w') as f:
+            json.dump(config, f, indent=4)
+        return config
+
+def create_rate_limiter(config: Dict) -> Optional[RateLimiter]:
+    """Limiter for every search and download of a process, or None when global_rate_limit is unset"""
+    return RateLimiter(config["global_rate_limit"]) if config["global_rate_limit"] else None
+
+def create_fetcher(config: Dict, cache: Optional[FetchCache] = None, rate_limiter: Optional[RateLimiter] = None) -> ArticleFetcher:
+    """Article fetcher configured from the scraper config"""
+    return ArticleFetcher(
+        max_workers=config["fetch_workers"],
+        per_host=config["fetch_per_host"],
+        politeness_delay=config["fetch_politeness_delay"],
+        timeout=config["fetch_timeout"],
+        retries=config["fetch_retries"],
+        cache=cache,
+        rate_limiter=rate_limiter,
+    )
+
+def create_fetch_cache(config: Dict) -> Optional[FetchCache]:
+    """Fetch cache shared by every run, or None when fetch_cache is disabled"""
+    return FetchCache(HTTP_CACHE_DIR, config["cache_ttls"]) if config["fetch_cache"] else None
+
+def create_media_stage(config: Dict, cache: Optional[FetchCache] = None) -> MediaStage:
+    """Media stage configured from the scraper config; batch runs share one so the download cap is global"""
+    # Local transcription needs the audio, so it is also gated on downloads being allowed
+    local = config["local_transcription"] and config["video_download"]
+    if local and not WHISPER_AVAILABLE:
+        logging.warning("Local transcription is enabled but Whisper is not installed")
+
+    @traced(category="scraper")
+    def transcribe_audio(audio_paths: List[Path]) -> Dict[Path, Optional[str]]:
+        """Transcribe downloaded audio locally on the shared Whisper worker pool"""
+        service = get_transcription_service(
+            WHISPER_CACHE_DIR,  # keyed by audio hash, so shared across profiles
+            model_name=config["whisper_model"],
+            workers=config["whisper_workers"] or None,
+            chunk_seconds=config["whisper_chunk_seconds"],
+        )
+        return service.transcribe(audio_paths)
+
+    return MediaStage(
+        AUDIO_DIR,
+        cache=cache,
+        transcriber=transcribe_audio if local and WHISPER_AVAILABLE else None,
+        max_downloads=config["audio_download_workers"],
+        ratelimit=config["audio_ratelimit"],
+    )
 
 class AgentProfileScraper:
-    def __init__(self, name: str, config_path: str = "config.json"):
+    def __init__(
+        self,
+        name: str,
+        config_path: str = "config.json",
+        fetcher: Optional[ArticleFetcher] = None,
+        cache: Optional[FetchCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        media: Optional[MediaStage] = None,
+    ):
         self.name = name
         self.config_path = config_path
         self.base_dir = Path(".")  # Use current directory instead of "staging"
         self.raw_data_dir = self.base_dir / "raw_data" / name
         self.processed_data_dir = self.base_dir / "processed_data" / name
         self.profiles_dir = self.base_dir / "profiles" / name
+        self.progress_path = self.processed_data_dir / "progress.jsonl"
+        self.analysis_dir = self.processed_data_dir / "analysis"
         
         # Create necessary directories
         for directory in [self.raw_data_dir, self.processed_data_dir, self.profiles_dir]:
             directory.mkdir(parents=True, exist_ok=True)
         
         self.load_config()
+        # Batch runs pass in a cache, fetcher, rate limiter and media stage shared by every profile
+        self.cache = cache if cache is not None else create_fetch_cache(self.config)
+        self.rate_limiter = rate_limiter or create_rate_limiter(self.config)
+        self.fetcher = fetcher or create_fetcher(self.config, self.cache, self.rate_limiter)
+        self.media = media or create_media_stage(self.config, self.cache)
         
     def load_config(self):
         """Load configuration from JSON file"""
-        try:
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
-        except FileNotFoundError:
-            self.config = {
-                "twitter_api_key": "",
-                "twitter_api_secret": "",
-                "twitter_access_token": "",
-                "twitter_access_token_secret": "",
-                "search_engines": ["google", "bing"],
-                "max_results": 50,
-                "video_download": True,
-                "transcribe_videos": True
-            }
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=4)
+        self.config = load_config(self.config_path)
     
-    def search_web(self) -> List[Dict]:
-        """Search the web for information about the person using multiple sources"""
-        results = []
-        
+    def search_jobs(self) -> List[Tuple[str, str]]:
+        """Every (query, engine) results page searched for the person"""
         # Define a smaller set of focused search queries
         search_queries = [
             f"{self.name} interview biography",
@@ -92,140 +202,89 @@ class AgentProfileScraper:
             f"{self.name} business ventures",
             f"{self.name} philanthropy"
         ]
-        # date filtering if needed
-        date_filter = "cdr:1,cd_min:1/1/2010,cd_max:12/31/2025"
-        
-        logging.info("Initializing Chrome WebDriver...")
-        chrome_options = Options()
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-        
+        return [(query, engine) for query in search_queries for engine in SEARCH_ENGINES]
+    
+    def search_job(self, job: Tuple[str, str]) -> List[Dict]:
+        """Results for one query on one engine, from the cache, a plain HTTP request or a pooled browser"""
+        search_query, engine = job
+        cached = self.cache.get("serp", self._search_url(engine, search_query)) if self.cache else None
+        if cached is not None:
+            return cached.body
+        if self._uses_http(engine):
+            results = self._search_http(job)
+            if not self._needs_browser(job, results):
+                return self._store_results(job, results or [])
+        pool = get_browser_pool(self.config["browser_pool_size"], self.config["page_load_timeout"])
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        with pool.driver() as driver:
+            results = self._run_search(driver, job)
+        return self._store_results(job, results)
+    
+    def _search_url(self, engine: str, search_query: str) -> str:
+        """Results page URL for a query on an engine"""
+        return SERP_PARSERS[engine].build_url(search_query)
+    
+    def _uses_http(self, engine: str) -> bool:
+        """Whether an engine's results page is fetched without a browser"""
+        mode = self.config["serp_fetch_mode"]
+        if mode not in SERP_FETCH_MODES:
+            raise ValueError(f"Unknown serp_fetch_mode: {mode} (expected one of {', '.join(SERP_FETCH_MODES)})")
+        return mode == "http" or (mode == "auto" and not SERP_PARSERS[engine].requires_js)
+    
+    def _needs_browser(self, job: Tuple[str, str], results: Optional[List[Dict]]) -> bool:
+        """Whether a plain HTTP search came back empty and should be retried in a browser"""
+        if results or self.config["serp_fetch_mode"] != "auto":
+            return False
+        # Usually a consent or bot-check page rather than a genuinely empty search
+        logging.info(f"No {job[1]} results over HTTP for '{job[0]}'; retrying in a browser")
+        return True
+    
+    def _search_http(self, job: Tuple[str, str]) -> Optional[List[Dict]]:
+        """Fetch a results page over the shared HTTP session and parse it, or None if the fetch failed"""
+        search_query, engine = job
+        parser = SERP_PARSERS[engine]
+        url = parser.build_url(search_query)
+        with tracer.span(f"search.{engine}", category="scraper", query=search_query, mode="http"):
+            # The parsed results are cached, not the page itself
+            page = self.fetcher.fetch(url, use_cache=False)
+            if not page.ok:
+                logging.error(f"Error searching {engine} for '{search_query}': {page.error}")
+                return None
+            return parser.parse_html(page.text, search_query, url)
+    
+    def _store_results(self, job: Tuple[str, str], results: List[Dict]) -> List[Dict]:
+        """Log and cache the parsed results of one search"""
+        search_query, engine = job
+        logging.info(f"Found {len(results)} {engine} results for: {search_query}")
+        if self.cache and results:
+            self.cache.put("serp", self._search_url(engine, search_query), results)
+        return results
+    
+    def _run_search(self, driver, job: Tuple[str, str]) -> List[Dict]:
+        """Run one query on one engine with a borrowed browser"""
+        search_query, engine = job
+        parser = SERP_PARSERS[engine]
+        url = parser.build_url(search_query)
+        with tracer.span(f"search.{engine}", category="scraper", query=search_query, mode="browser"):
+            html = self._render(driver, url, parser.result_selector)
+            return parser.parse_html(html, search_query, url) if html else []
+    
+    def _render(self, driver, url: str, selector: str) -> Optional[str]:
+        """Load a results page and return its rendered HTML once result elements appear, instead of sleeping"""
+        driver.get(url)
         try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(30)
-            logging.info("Chrome WebDriver initialized successfully")
-            
-            # Process each search query
-            for i, search_query in enumerate(search_queries, 1):
-                logging.info(f"Processing search query {i}/{len(search_queries)}: {search_query}")
-                encoded_query = quote_plus(search_query)
-                
-                # Search Google News
-                logging.info(f"Searching Google News for: {search_query}")
-                news_url = f"https://www.google.com/search?q={encoded_query}&tbm=nws&tbs={date_filter}"
-                driver.get(news_url)
-                time.sleep(2)
-                
-                # Extract news results
-                news_results = driver.find_elements(By.CSS_SELECTOR, "div.SoaBEf")
-                logging.info(f"Found {len(news_results)} news results")
-                for result in news_results[:5]:  # Limit to 5 results per query
-                    try:
-                        link = result.find_element(By.CSS_SELECTOR, "a").get_attribute("href")
-                        title = result.find_element(By.CSS_SELECTOR, "div.n0jPhd").text
-                        snippet = result.find_element(By.CSS_SELECTOR, "div.GI74Re").text
-                        date = result.find_element(By.CSS_SELECTOR, "div.LfVVr").text
-                        
-                        results.append({
-                            "type": "article",
-                            "url": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": "google_news",
-                            "query": search_query
-                        })
-                    except Exception as e:
-                        logging.warning(f"Error extracting news result: {str(e)}")
-                
-                # Search regular Google with date filter
-                logging.info(f"Searching Google for: {search_query}")
-                google_url = f"https://www.google.com/search?q={encoded_query}&tbs={date_filter}"
-                driver.get(google_url)
-                time.sleep(2)
-                
-                # Extract search results
-                search_results = driver.find_elements(By.CSS_SELECTOR, "div.g")
-                logging.info(f"Found {len(search_results)} Google results")
-                for result in search_results[:5]:  # Limit to 5 results per query
-                    try:
-                        link = result.find_element(By.CSS_SELECTOR, "a").get_attribute("href")
-                        title = result.find_element(By.CSS_SELECTOR, "h3").text
-                        snippet = result.find_element(By.CSS_SELECTOR, "div.VwiC3b").text
-                        
-                        # Determine content type
-                        content_type = "article"
-                        if any(video_site in link.lower() for video_site in ["youtube.com", "vimeo.com"]):
-                            content_type = "video"
-                        elif any(social_site in link.lower() for social_site in ["twitter.com", "linkedin.com", "facebook.com"]):
-                            content_type = "social"
-                        
-                        results.append({
-                            "type": content_type,
-                            "url": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "source": "google",
-                            "query": search_query
-                        })
-                    except Exception as e:
-                        logging.warning(f"Error extracting Google result: {str(e)}")
-                
-                # Search YouTube with date filter
-                logging.info(f"Searching YouTube for: {search_query}")
-                youtube_query = f"{encoded_query}&sp=EgIYAQ%253D%253D"
-                youtube_url = f"https://www.youtube.com/results?search_query={youtube_query}"
-                driver.get(youtube_url)
-                time.sleep(2)
-                
-                video_results = driver.find_elements(By.CSS_SELECTOR, "ytd-video-renderer")
-                logging.info(f"Found {len(video_results)} YouTube results")
-                for video in video_results[:3]:  # Limit to 3 results per query
-                    try:
-                        link = video.find_element(By.CSS_SELECTOR, "a#video-title").get_attribute("href")
-                        title = video.find_element(By.CSS_SELECTOR, "a#video-title").text
-                        channel = video.find_element(By.CSS_SELECTOR, "ytd-channel-name a").text
-                        
-                        results.append({
-                            "type": "video",
-                            "url": link,
-                            "title": title,
-                            "channel": channel,
-                            "source": "youtube",
-                            "query": search_query
-                        })
-                    except Exception as e:
-                        logging.warning(f"Error extracting YouTube result: {str(e)}")
-                
-                logging.info(f"Completed search query {i}/{len(search_queries)}")
-            
-        except Exception as e:
-            logging.error(f"Error in web search: {str(e)}")
-            raise
-        finally:
-            try:
-                driver.quit()
-            except:
-                pass
-        
-        # Remove duplicates based on URL
-        unique_results = []
-        seen_urls = set()
-        for result in results:
-            if result["url"] not in seen_urls:
-                seen_urls.add(result["url"])
-                unique_results.append(result)
-        
-        logging.info(f"Found {len(unique_results)} unique results for {self.name}")
-        return unique_results
+            WebDriverWait(driver, self.config["search_wait_timeout"]).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+        except TimeoutException:
+            logging.info(f"No results matching '{selector}' appeared on {url}")
+            return None
+        return driver.page_source
     
-    def extract_article_content(self, url: str) -> Dict:
-        """Extract content from a news article"""
+    @traced(category="scraper")
+    def extract_article_content(self, url: str, html: Optional[str] = None) -> Dict:
+        """Extract content from a news article, parsing already downloaded HTML when given"""
         try:
             # Skip Forbes articles as they block our requests
             if "forbes.com" in url:
@@ -233,7 +292,10 @@ class AgentProfileScraper:
                 return {}
                 
             article = Article(url)
-            article.download()
+            if html is not None:
+                article.download(input_html=html)
+            else:
+                article.download()
             article.parse()
             
             # Skip NLP processing since it's causing issues with punkt
@@ -249,138 +311,17 @@ class AgentProfileScraper:
             logging.error(f"Error extracting article content from {url}: {str(e)}")
             return {}
     
-    def download_video(self, video_url: str) -> Optional[str]:
-        """Download video content"""
-        if not self.config["video_download"]:
-            return None
-            
-        try:
-            ydl_opts = {
-                'format': 'best',
-                'outtmpl': str(self.raw_data_dir / f'video_{datetime.now().strftime("%Y%m%d_%H%M%S")}.mp4')
-            }
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([video_url])
-                return ydl_opts['outtmpl']
-        except Exception as e:
-            logging.error(f"Error downloading video from {video_url}: {str(e)}")
-            return None
-    
-    def transcribe_video(self, video_url: str) -> Optional[str]:
-        """Transcribe video content using YouTube's transcript API"""
+    @traced(category="scraper")
+    def process_videos(self, video_urls: List[str]) -> List[Dict]:
+        """Collect transcripts for videos, downloading audio only when no transcript is published"""
         if not self.config["transcribe_videos"]:
             logging.info("Video transcription is disabled")
-            return None
-            
-        try:
-            # Extract video ID from URL
-            video_id = None
-            if "youtube.com" in video_url or "youtu.be" in video_url:
-                if "youtube.com" in video_url:
-                    video_id = video_url.split("v=")[1].split("&")[0]
-                else:  # youtu.be
-                    video_id = video_url.split("/")[-1]
-                
-                # Get transcript
-                transcript = YouTubeTranscriptApi.get_transcript(video_id)
-                # Combine all transcript pieces
-                full_text = " ".join([entry["text"] for entry in transcript])
-                return full_text
-            else:
-                logging.info(f"Video URL {video_url} is not a YouTube video, skipping transcription")
-                return None
-                
-        except Exception as e:
-            logging.error(f"Error transcribing video {video_url}: {str(e)}")
-            return None
-    
-    def analyze_content(self, content: List[Dict]) -> Dict:
-        """Analyze content to extract personality traits and characteristics"""
-        analysis = {
-            "goals": [],
-            "motivations": [],
-            "behaviors": [],
-            "pain_points": [],
-            "communication_style": [],
-            "tone": [],
-            "practical_advice": []
-        }
-        
-        # Keywords and patterns for different categories
-        patterns = {
-            "goals": [
-                r"aims to", r"goal is to", r"wants to", r"seeks to", r"strives to",
-                r"objective is", r"mission is", r"vision is", r"aspires to"
-            ],
-            "motivations": [
-                r"motivated by", r"driven by", r"inspired by", r"passionate about",
-                r"believes in", r"values", r"cares about", r"dedicated to"
-            ],
-            "behaviors": [
-                r"always", r"typically", r"usually", r"often", r"frequently",
-                r"known for", r"characteristically", r"consistently"
-            ],
-            "pain_points": [
-                r"challenge", r"struggle", r"difficulty", r"problem", r"issue",
-                r"concern", r"worry", r"frustration", r"obstacle"
-            ],
-            "communication_style": [
-                r"speaks", r"communicates", r"expresses", r"articulates",
-                r"presents", r"conveys", r"shares", r"discusses"
-            ],
-            "tone": [
-                r"tone", r"manner", r"style", r"approach", r"attitude",
-                r"demeanor", r"personality", r"character"
-            ],
-            "practical_advice": [
-                r"advice", r"recommendation", r"suggestion", r"tip",
-                r"guidance", r"insight", r"lesson", r"wisdom"
-            ]
-        }
-        
-        # Process each content item
-        for item in content:
-            text = ""
-            if "text" in item:
-                text = item["text"]
-            elif "snippet" in item:
-                text = item["snippet"]
-            elif "title" in item:
-                text = item["title"]
-            
-            if not text:
-                continue
-            
-            # Convert to lowercase for case-insensitive matching
-            text_lower = text.lower()
-            
-            # Extract sentences containing relevant patterns
-            sentences = re.split(r'[.!?]+', text)
-            for sentence in sentences:
-                sentence = sentence.strip()
-                if not sentence:
-                    continue
-                
-                # Check each category's patterns
-                for category, category_patterns in patterns.items():
-                    for pattern in category_patterns:
-                        if re.search(pattern, sentence.lower()):
-                            # Clean and format the sentence
-                            cleaned_sentence = re.sub(r'\s+', ' ', sentence).strip()
-                            if cleaned_sentence and len(cleaned_sentence) > 10:  # Avoid very short matches
-                                if cleaned_sentence not in analysis[category]:
-                                    analysis[category].append(cleaned_sentence)
-        
-        # Remove duplicates and sort
-        for category in analysis:
-            analysis[category] = sorted(list(set(analysis[category])))
-        
-        # If any category is empty, add a default message
-        for category in analysis:
-            if not analysis[category]:
-                analysis[category].append(f"No specific {category} identified in the content.")
-        
-        return analysis
+            return []
+        return [
+            {"type": "video_transcript", "text": result.transcript, "url": result.url}
+            for result in self.media.process(video_urls)
+            if result.transcript
+        ]
     
     def generate_profile(self, analysis: Dict) -> str:
         """Generate markdown profile from analysis"""
@@ -412,32 +353,121 @@ class AgentProfileScraper:
 """
         return profile
     
-    def run(self):
-        """Main execution method"""
-        logging.info(f"Starting profile scraping for {self.name}")
+    def near_duplicate_filter(self) -> Optional[NearDuplicateFilter]:
+        """MinHash filter for the run, or None when dedup_threshold is unset"""
+        if not self.config["dedup_threshold"]:
+            return None
+        return NearDuplicateFilter(self.config["dedup_threshold"], num_perm=self.config["dedup_num_perm"])
+    
+    def build_pipeline(
+        self,
+        analyzer: ContentAnalyzer,
+        duplicates: Optional[NearDuplicateFilter] = None,
+        state: Optional[ProfileState] = None,
+        store: Optional[AnalysisStore] = None,
+    ) -> Pipeline:
+        """Streaming search -> fetch -> extract -> analyze pipeline feeding an analyzer"""
+        # Content already extracted by an interrupted run is not fetched again
+        seen = set(state.content) if state else set()
+        seen_lock = threading.Lock()
         
-        # Search web for content
-        search_results = self.search_web()
+        def search(job: Tuple[str, str]):
+            if state and job in state.searches:
+                results = state.searches[job]
+            else:
+                try:
+                    results = self.search_job(job)
+                except Exception as e:
+                    logging.error(f"Error searching {job[1]} for '{job[0]}': {str(e)}")
+                    return
+                if state:
+                    state.record_search(job, results)
+            for result in results:
+                # Remove duplicates based on URL, or video ID for videos
+                key = media_key(result["url"]) if result.get("type") == "video" else result["url"]
+                with seen_lock:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                yield result
         
-        # Process each result
-        processed_content = []
-        for result in search_results:
+        def fetch(result: Dict):
             if result.get("type") == "article":
-                content = self.extract_article_content(result["url"])
-                processed_content.append(content)
+                # Skip Forbes articles as they block our requests
+                if "forbes.com" in result["url"]:
+                    logging.warning(f"Skipping Forbes article: {result['url']}")
+                    return
+                page = self.fetcher.fetch(result["url"])
+                if page.ok:
+                    yield {"result": result, "html": page.text}
+                else:
+                    logging.error(f"Error downloading article {page.url}: {page.error}")
             elif result.get("type") == "video":
-                video_path = self.download_video(result["url"])
-                if video_path:
-                    transcript = self.transcribe_video(result["url"])
-                    if transcript:
-                        processed_content.append({
-                            "type": "video_transcript",
-                            "text": transcript,
-                            "url": result["url"]
-                        })
+                for content in self.process_videos([result["url"]]):
+                    yield {"result": result, "content": content}
+        
+        def extract(page: Dict):
+            content = page.get("content") or self.extract_article_content(page["result"]["url"], page["html"])
+            if not content:
+                return
+            # Syndicated copies of a story are dropped before they reach the analyzer
+            original = duplicates.check(content["url"], item_text(content) or "") if duplicates else None
+            if original:
+                logging.info(f"Skipping {content['url']}: near-duplicate of {original}")
+                return
+            if state:
+                state.record_content(content)
+            yield content
         
-        # Analyze content
-        analysis = self.analyze_content(processed_content)
+        def analyze(content: Dict):
+            with tracer.span("analyze_content", category="scraper", url=content["url"]):
+                if store:
+                    analyzer.merge(store.analyze(content))
+                else:
+                    analyzer.add(content)
+            return ()
+        
+        return Pipeline([
+            Stage("search", search, workers=self.config["browser_pool_size"]),
+            Stage("fetch", fetch, workers=self.config["fetch_workers"]),
+            Stage("extract", extract, workers=self.config["extract_workers"]),
+            # The analyzer is not thread-safe and is cheap next to the network stages
+            Stage("analyze", analyze, workers=1),
+        ], queue_size=self.config["pipeline_queue_size"])
+    
+    @traced(category="scraper")
+    def run(self, resume: bool = False):
+        """Main execution method; with resume, continue from the progress recorded by an earlier run"""
+        state = ProfileState.load(self.progress_path)
+        if not resume:
+            state.reset()
+        elif state.done:
+            logging.info(f"Profile for {self.name} was already generated")
+            return Path(state.profile_path)
+        logging.info(f"Starting profile scraping for {self.name}")
+        
+        # The profile covers the sources found by this run; stored per-source results are reused,
+        # so only new or changed sources are analyzed
+        store = AnalysisStore(self.analysis_dir)
+        analyzer = ContentAnalyzer()
+        duplicates = self.near_duplicate_filter()
+        if state.content:
+            logging.info(f"Resuming with {len(state.content)} items and {len(state.searches)} searches from the last run")
+        for content in state.content.values():
+            if duplicates:
+                duplicates.check(content["url"], item_text(content) or "")
+            analyzer.merge(store.analyze(content))
+        
+        # Search, fetch, extract and analyze concurrently; analysis starts with the first article
+        pipeline = self.build_pipeline(analyzer, duplicates, state, store)
+        for _ in pipeline.run(self.search_jobs()):
+            pass
+        logging.info(pipeline.summary())
+        store.save()
+        logging.info(store.summary())
+        if duplicates:
+            logging.info(duplicates.summary())
+        analysis = analyzer.result()
         
         # Generate profile
         profile = self.generate_profile(analysis)
@@ -446,12 +476,9 @@ class AgentProfileScraper:
         profile_path = self.profiles_dir / f"{self.name.lower().replace(' ', '_')}_profile.md"
         with open(profile_path, 'w') as f:
             f.write(profile)
+        state.record_done(profile_path)
         
+        if self.cache:
+            logging.info(self.cache.summary())
         logging.info(f"Profile generation completed for {self.name}")
         return profile_path
-
-if __name__ == "__main__":
-    # Example usage
-    scraper = AgentProfileScraper("Frank McCourt")
-    profile_path = scraper.run()
-    print(f"Profile generated at: {profile_path}") 
\ No newline at end of file
@@ -0,0 +1,134 @@
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, List, Optional
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+@lru_cache(maxsize=None)
+def chromedriver_path() -> str:
+    """Resolve (and download if needed) the ChromeDriver binary once per process."""
+    logging.info("Resolving ChromeDriver...")
+    return ChromeDriverManager().install()
+
+def chrome_options() -> Options:
+    """Headless Chrome options used for scraping"""
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument(f"--user-agent={USER_AGENT}")
+    return options
+
+class BrowserPool:
+    """Pool of reusable headless Chrome instances shared by concurrent scraping threads.
+
+    Drivers are started lazily, up to ``size``, and kept for the lifetime of
+    the pool so repeated searches do not pay for browser startup again.
+    """
+
+    def __init__(self, size: int = 4, page_load_timeout: int = 30):
+        """Initialize the pool.
+
+        Args:
+            size: Maximum number of concurrent browsers
+            page_load_timeout: Seconds before a page load is aborted
+        """
+        self.size = size
+        self.page_load_timeout = page_load_timeout
+        self._idle: List[webdriver.Chrome] = []
+        self._created = 0
+        self._lock = threading.Lock()
+        # Signalled whenever a driver is returned or a slot frees up for a new one
+        self._available = threading.Condition(self._lock)
+        self._drivers: List[webdriver.Chrome] = []
+        self._closed = False
+
+    def _create_driver(self) -> webdriver.Chrome:
+        logging.info("Initializing Chrome WebDriver...")
+        driver = webdriver.Chrome(service=Service(chromedriver_path()), options=chrome_options())
+        driver.set_page_load_timeout(self.page_load_timeout)
+        logging.info("Chrome WebDriver initialized successfully")
+        return driver
+
+    @contextmanager
+    def driver(self) -> Iterator[webdriver.Chrome]:
+        """Borrow a driver, starting a new one while the pool is not full and waiting otherwise."""
+        with self._available:
+            while not self._closed and not self._idle and self._created >= self.size:
+                self._available.wait()
+            if self._closed:
+                raise RuntimeError("Browser pool is closed")
+            driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                self._created += 1
+        if driver is None:
+            try:
+                driver = self._create_driver()
+            except Exception:
+                with self._available:
+                    self._created -= 1
+                    self._available.notify()
+                raise
+            with self._lock:
+                self._drivers.append(driver)
+
+        healthy = True
+        try:
+            yield driver
+        except WebDriverException:
+            # A crashed or wedged browser is replaced rather than reused
+            healthy = False
+            raise
+        finally:
+            if healthy:
+                with self._available:
+                    self._idle.append(driver)
+                    self._available.notify()
+            else:
+                self._discard(driver)
+
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        with self._available:
+            self._created -= 1
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            # A waiting borrower may now start a replacement
+            self._available.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Quit every browser in the pool."""
+        with self._available:
+            self._closed = True
+            drivers, self._drivers, self._idle = self._drivers, [], []
+            self._available.notify_all()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+def get_browser_pool(size: int = 4, page_load_timeout: int = 30) -> BrowserPool:
+    """Return the process-wide browser pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(size, page_load_timeout)
+            atexit.register(_pool.close)
+        return _pool
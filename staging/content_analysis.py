@@ -0,0 +1,255 @@
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+# Keywords and patterns for different categories (literal, lowercase phrases)
+ANALYSIS_PATTERNS = {
+    "goals": [
+        "aims to", "goal is to", "wants to", "seeks to", "strives to",
+        "objective is", "mission is", "vision is", "aspires to"
+    ],
+    "motivations": [
+        "motivated by", "driven by", "inspired by", "passionate about",
+        "believes in", "values", "cares about", "dedicated to"
+    ],
+    "behaviors": [
+        "always", "typically", "usually", "often", "frequently",
+        "known for", "characteristically", "consistently"
+    ],
+    "pain_points": [
+        "challenge", "struggle", "difficulty", "problem", "issue",
+        "concern", "worry", "frustration", "obstacle"
+    ],
+    "communication_style": [
+        "speaks", "communicates", "expresses", "articulates",
+        "presents", "conveys", "shares", "discusses"
+    ],
+    "tone": [
+        "tone", "manner", "style", "approach", "attitude",
+        "demeanor", "personality", "character"
+    ],
+    "practical_advice": [
+        "advice", "recommendation", "suggestion", "tip",
+        "guidance", "insight", "lesson", "wisdom"
+    ]
+}
+
+SENTENCE_SPLIT = re.compile(r'[.!?]+')
+WHITESPACE = re.compile(r'\s+')
+
+def trie_pattern(literals: Iterable[str]) -> str:
+    """Regex matching the longest of the literals, factored into a trie so each position is tried once"""
+    trie: Dict = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional tail prefers the longer literal when a shorter one also ends here
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+def item_text(item: Dict) -> str:
+    """Text analyzed for a content item: its text, else its snippet, else its title"""
+    if "text" in item:
+        return item["text"]
+    elif "snippet" in item:
+        return item["snippet"]
+    elif "title" in item:
+        return item["title"]
+    return ""
+
+class ContentAnalyzer:
+    """Accumulates category sentences from content with a single compiled matcher.
+
+    All patterns are folded into one trie-shaped regex inside a lookahead, so
+    a single scan of each lowercased sentence finds the longest pattern
+    starting at every position. Every pattern that is a prefix of a matched
+    literal also occurs there, so each literal is tagged with the categories
+    of all of its prefixes; this finds exactly the patterns a per-pattern
+    search would find.
+    """
+
+    def __init__(self, patterns: Optional[Dict[str, List[str]]] = None):
+        """Initialize the analyzer.
+
+        Args:
+            patterns: Literal lowercase phrases per category (defaults to ANALYSIS_PATTERNS)
+        """
+        self.patterns = patterns or ANALYSIS_PATTERNS
+        literals = {p for ps in self.patterns.values() for p in ps}
+        self.matcher = re.compile(f"(?=({trie_pattern(literals)}))")
+        self.literal_categories: Dict[str, FrozenSet[str]] = {
+            literal: frozenset(
+                category for category, ps in self.patterns.items()
+                if any(literal.startswith(p) for p in ps)
+            )
+            for literal in literals
+        }
+        self.sentences: Dict[str, Set[str]] = {category: set() for category in self.patterns}
+
+    def add_text(self, text: str) -> None:
+        """Add the matching sentences of one text"""
+        if not text:
+            return
+        for sentence in SENTENCE_SPLIT.split(text):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            categories = set()
+            for literal in self.matcher.findall(sentence.lower()):
+                categories |= self.literal_categories[literal]
+            if not categories:
+                continue
+            # Clean and format the sentence, avoiding very short matches
+            cleaned_sentence = WHITESPACE.sub(' ', sentence).strip()
+            if len(cleaned_sentence) > 10:
+                for category in categories:
+                    self.sentences[category].add(cleaned_sentence)
+
+    def add(self, item: Dict) -> None:
+        """Add one content item"""
+        self.add_text(item_text(item))
+
+    def add_all(self, content: Iterable[Dict]) -> "ContentAnalyzer":
+        for item in content:
+            self.add(item)
+        return self
+
+    def merge(self, sentences: Dict[str, Iterable[str]]) -> "ContentAnalyzer":
+        """Fold in sentences collected elsewhere, e.g. by another process"""
+        for category, category_sentences in sentences.items():
+            self.sentences.setdefault(category, set()).update(category_sentences)
+        return self
+
+    def result(self) -> Dict[str, List[str]]:
+        """Sorted sentences per category, with a default message for empty categories"""
+        analysis = {}
+        for category, category_sentences in self.sentences.items():
+            analysis[category] = sorted(category_sentences) or [f"No specific {category} identified in the content."]
+        return analysis
+
+def _analyze_chunk(texts: List[str]) -> Dict[str, Set[str]]:
+    analyzer = ContentAnalyzer()
+    for text in texts:
+        analyzer.add_text(text)
+    return analyzer.sentences
+
+def analyze_content(content: List[Dict], workers: int = 0, chunk_size: int = 64) -> Dict[str, List[str]]:
+    """Extract category sentences from content items.
+
+    Args:
+        content: Items with text, snippet or title fields
+        workers: Processes to spread the work over; 0 analyzes in this process
+        chunk_size: Texts per task when using processes
+
+    Returns:
+        Sorted sentences per category
+    """
+    analyzer = ContentAnalyzer()
+    if workers <= 0:
+        return analyzer.add_all(content).result()
+
+    # Only the text crosses the process boundary
+    texts = [text for text in (item_text(item) for item in content) if text]
+    chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for sentences in executor.map(_analyze_chunk, chunks):
+            analyzer.merge(sentences)
+    return analyzer.result()
+
+class AnalysisStore:
+    """Per-source analysis results persisted by content hash.
+
+    Each analyzed text is stored as ``<directory>/<sha256 of text>.json`` with
+    the sentences it contributed per category and a fingerprint of the
+    patterns used. Unchanged sources are merged from disk instead of being
+    analyzed again; entries made with different patterns are ignored. An
+    index maps every source URL to the hash of its current text, so results
+    for a source's earlier versions are deleted on ``save``. Not thread-safe.
+    """
+
+    def __init__(self, directory: Path, patterns: Optional[Dict[str, List[str]]] = None):
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding the per-source results
+            patterns: Patterns the results are computed with (defaults to ANALYSIS_PATTERNS)
+        """
+        self.directory = Path(directory)
+        self.patterns = patterns or ANALYSIS_PATTERNS
+        self.fingerprint = hashlib.sha256(json.dumps(self.patterns, sort_keys=True).encode()).hexdigest()[:16]
+        self.index_path = self.directory / "index.json"
+        try:
+            self.index: Dict[str, str] = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            self.index = {}
+        self._superseded: Set[str] = set()
+        self.analyzed = 0
+        self.reused = 0
+        self.removed = 0
+
+    def _load(self, path: Path) -> Optional[Dict]:
+        try:
+            record = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        return record if record.get("patterns") == self.fingerprint else None
+
+    def _write(self, path: Path, data: Dict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data))
+        os.replace(tmp, path)
+
+    def analyze(self, item: Dict) -> Dict[str, List[str]]:
+        """Category sentences of one source, analyzing it only if it is new or changed"""
+        text = item_text(item)
+        if not text:
+            return {}
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        url = item.get("url")
+        if url:
+            previous = self.index.get(url)
+            if previous and previous != digest:
+                self._superseded.add(previous)
+            self.index[url] = digest
+
+        path = self.directory / f"{digest}.json"
+        record = self._load(path)
+        if record is not None:
+            self.reused += 1
+            return record["sentences"]
+
+        analyzer = ContentAnalyzer(self.patterns)
+        analyzer.add_text(text)
+        sentences = {category: sorted(found) for category, found in analyzer.sentences.items() if found}
+        self._write(path, {"url": url, "patterns": self.fingerprint, "sentences": sentences})
+        self.analyzed += 1
+        return sentences
+
+    def save(self) -> None:
+        """Persist the URL index and delete results only earlier versions of a source used"""
+        current = set(self.index.values())
+        for digest in self._superseded - current:
+            path = self.directory / f"{digest}.json"
+            if path.exists():
+                path.unlink()
+                self.removed += 1
+        self._superseded.clear()
+        self._write(self.index_path, self.index)
+
+    def summary(self) -> str:
+        return (f"Analyzed {self.analyzed} new or changed sources, reused {self.reused} stored analyses, "
+                f"removed {self.removed} outdated ones")
@@ -0,0 +1,111 @@
+import re
+import threading
+import zlib
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
+
+# Universal hashing is done modulo a Mersenne prime and truncated to 32 bits
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+WORD = re.compile(r"\w+")
+
+def shingles(text: str, size: int = 5) -> Set[int]:
+    """32-bit hashes of the overlapping word n-grams of a text"""
+    words = WORD.findall(text.lower())
+    if len(words) <= size:
+        return {zlib.crc32(" ".join(words).encode())} if words else set()
+    # crc32 is stable across processes, unlike hash()
+    return {zlib.crc32(" ".join(words[i:i + size]).encode()) for i in range(len(words) - size + 1)}
+
+def _probability(threshold: float, bands: int, rows: int, above: bool) -> float:
+    """Integrated chance that a pair below (false positive) or above (false negative) the threshold is misjudged"""
+    low, high = (threshold, 1.0) if above else (0.0, threshold)
+    points = np.linspace(low, high, 101)
+    candidate = 1 - (1 - points ** rows) ** bands
+    misjudged = 1 - candidate if above else candidate
+    # Trapezoidal rule over the evenly spaced points
+    return float((misjudged.sum() - (misjudged[0] + misjudged[-1]) / 2) * (high - low) / 100)
+
+def optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """LSH (bands, rows) minimizing false positives plus false negatives around a Jaccard threshold"""
+    best, best_error = (1, num_perm), float("inf")
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            error = _probability(threshold, bands, rows, above=False) + _probability(threshold, bands, rows, above=True)
+            if error < best_error:
+                best, best_error = (bands, rows), error
+    return best
+
+class NearDuplicateFilter:
+    """Drops texts that are near-copies of one already seen, using MinHash and LSH.
+
+    Every text is reduced to a MinHash signature over its word shingles. The
+    signature is cut into bands; texts sharing any band bucket are candidates,
+    and a candidate is a duplicate when the signatures' estimated Jaccard
+    similarity reaches ``threshold``. Safe to call from several threads.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        """Initialize the filter.
+
+        Args:
+            threshold: Estimated Jaccard similarity at which a text counts as a duplicate
+            num_perm: Number of hash permutations in each signature
+            shingle_size: Words per shingle
+            seed: Seed for the permutation parameters, fixed so signatures are reproducible
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, int(MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(self.bands)]
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+        self.checked = 0
+        self.dropped = 0
+        self.checked_chars = 0
+        self.dropped_chars = 0
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of a text, or None when it has no words"""
+        hashes = shingles(text, self.shingle_size)
+        if not hashes:
+            return None
+        values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+        # uint64 arithmetic wraps on overflow, which keeps this a valid hash family
+        with np.errstate(over="ignore"):
+            permuted = (np.outer(self._a, values) + self._b[:, None]) % MERSENNE_PRIME & MAX_HASH
+        return permuted.min(axis=1)
+
+    def check(self, key: str, text: str) -> Optional[str]:
+        """Record a text, returning the key of the earlier text it duplicates (None if it is new)"""
+        signature = self.signature(text)
+        with self._lock:
+            self.checked += 1
+            self.checked_chars += len(text)
+            if signature is None:
+                return None
+            bands = [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+            candidates = dict.fromkeys(
+                other for band, bucket in zip(bands, self._buckets) for other in bucket.get(band, ())
+            )
+            for other in candidates:
+                if np.mean(self._signatures[other] == signature) >= self.threshold:
+                    self.dropped += 1
+                    self.dropped_chars += len(text)
+                    return other
+            self._signatures[key] = signature
+            for band, bucket in zip(bands, self._buckets):
+                bucket.setdefault(band, []).append(key)
+            return None
+
+    def summary(self) -> str:
+        share = self.dropped_chars / self.checked_chars if self.checked_chars else 0.0
+        return (
+            f"Near-duplicate filter (Jaccard >= {self.threshold}, {self.bands} bands x {self.rows} rows): "
+            f"dropped {self.dropped}/{self.checked} texts, {share:.0%} of the text"
+        )
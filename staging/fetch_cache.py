@@ -0,0 +1,162 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = ("fbclid", "gclid", "mc_cid", "mc_eid")
+TRACKING_PREFIXES = ("utm_",)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Seconds a cached response is served without contacting the origin
+DEFAULT_TTLS = {
+    "article": 7 * 24 * 3600,
+    "serp": 24 * 3600,
+    "transcript": 30 * 24 * 3600,
+}
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL so trivially different spellings share a cache entry"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+@dataclass
+class CacheEntry:
+    """A cached response body with the headers needed to revalidate it"""
+    kind: str
+    url: str
+    body: Any
+    fetched_at: float
+    headers: Dict[str, str] = field(default_factory=dict)
+    ttl: float = 0.0
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() - self.fetched_at < self.ttl
+
+    def header(self, name: str) -> Optional[str]:
+        """Look up a stored header case-insensitively"""
+        name = name.lower()
+        return next((value for key, value in self.headers.items() if key.lower() == name), None)
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating a stale entry"""
+        headers = {}
+        if self.header("ETag"):
+            headers["If-None-Match"] = self.header("ETag")
+        if self.header("Last-Modified"):
+            headers["If-Modified-Since"] = self.header("Last-Modified")
+        return headers
+
+class FetchCache:
+    """Content-addressed on-disk cache for pages, search results and transcripts.
+
+    Entries live at ``<root>/<kind>/<sha256 of canonical URL>.json`` and hold
+    the body, response headers and fetch time. Fresh entries are served
+    directly; stale ones keep their ETag/Last-Modified so the caller can
+    revalidate with a conditional request instead of downloading again.
+    """
+
+    def __init__(self, root: Path, ttls: Optional[Dict[str, float]] = None):
+        """Initialize the cache.
+
+        Args:
+            root: Directory holding the cache entries
+            ttls: Seconds each kind of entry stays fresh, merged over DEFAULT_TTLS
+        """
+        self.root = Path(root)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _path(self, kind: str, url: str) -> Path:
+        digest = hashlib.sha256(canonical_url(url).encode()).hexdigest()
+        return self.root / kind / f"{digest}.json"
+
+    def _count(self, kind: str, outcome: str) -> None:
+        with self._lock:
+            counts = self.stats.setdefault(kind, {"hits": 0, "revalidated": 0, "misses": 0})
+            counts[outcome] += 1
+
+    def lookup(self, kind: str, url: str) -> Optional[CacheEntry]:
+        """Return the stored entry for a URL, fresh or stale, without counting it"""
+        path = self._path(kind, url)
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable cache entry {path}: {str(e)}")
+            return None
+        return CacheEntry(
+            kind=kind,
+            url=data["url"],
+            body=data["body"],
+            fetched_at=data["fetched_at"],
+            headers=data.get("headers", {}),
+            ttl=self.ttls.get(kind, 0),
+        )
+
+    def get(self, kind: str, url: str) -> Optional[CacheEntry]:
+        """Return a fresh entry for a URL, recording a hit or a miss"""
+        entry = self.lookup(kind, url)
+        if entry is not None and entry.fresh:
+            self._count(kind, "hits")
+            return entry
+        self._count(kind, "misses")
+        return None
+
+    def put(self, kind: str, url: str, body: Any, headers: Optional[Dict[str, str]] = None) -> CacheEntry:
+        """Store a response body; the write is atomic so readers never see partial entries"""
+        entry = CacheEntry(kind=kind, url=url, body=body, fetched_at=time.time(),
+                           headers=dict(headers or {}), ttl=self.ttls.get(kind, 0))
+        path = self._path(kind, url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps({
+            "url": url,
+            "canonical_url": canonical_url(url),
+            "fetched_at": entry.fetched_at,
+            "headers": entry.headers,
+            "body": body,
+        }))
+        os.replace(tmp, path)
+        return entry
+
+    def revalidated(self, entry: CacheEntry, headers: Optional[Dict[str, str]] = None) -> CacheEntry:
+        """Mark a stale entry fresh again after the origin answered 304 Not Modified"""
+        # A miss was already counted by get(); the 304 turns it into a cheap revalidation
+        with self._lock:
+            counts = self.stats.setdefault(entry.kind, {"hits": 0, "revalidated": 0, "misses": 0})
+            counts["misses"] -= 1
+            counts["revalidated"] += 1
+        return self.put(entry.kind, entry.url, entry.body, {**entry.headers, **(headers or {})})
+
+    def hit_rate(self) -> float:
+        """Share of lookups answered without downloading the body again"""
+        lookups = sum(sum(counts.values()) for counts in self.stats.values())
+        saved = sum(counts["hits"] + counts["revalidated"] for counts in self.stats.values())
+        return saved / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """One line per kind with hits, revalidations and misses"""
+        lines = [f"Fetch cache hit rate: {self.hit_rate():.0%}"]
+        for kind, counts in sorted(self.stats.items()):
+            lines.append(f"  {kind}: {counts['hits']} hits, {counts['revalidated']} revalidated, {counts['misses']} misses")
+        return "\n".join(lines)
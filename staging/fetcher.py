@@ -0,0 +1,170 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, Optional
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from browser_pool import USER_AGENT
+from fetch_cache import FetchCache
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching a single URL"""
+    url: str
+    status: Optional[int] = None
+    text: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    from_cache: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status is not None and 200 <= self.status < 300
+
+class RateLimiter:
+    """Spaces requests evenly so that at most ``rate`` start per second, shared across threads"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def acquire(self) -> None:
+        """Block until the caller may start its request"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+class ArticleFetcher:
+    """Downloads pages concurrently over one pooled HTTP session.
+
+    Requests to the same host are capped at ``per_host`` in flight and spaced
+    at least ``politeness_delay`` seconds apart. Connection errors and
+    retryable status codes are retried with exponential backoff. With a
+    ``cache``, fresh pages are served from disk and stale ones are revalidated
+    with a conditional request.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        per_host: int = 2,
+        politeness_delay: float = 1.0,
+        timeout: float = 15.0,
+        retries: int = 3,
+        backoff: float = 0.5,
+        cache: Optional[FetchCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """Initialize the fetcher.
+
+        Args:
+            max_workers: Total concurrent downloads
+            per_host: Concurrent downloads allowed per host
+            politeness_delay: Minimum seconds between request starts to the same host
+            timeout: Connect/read timeout per request in seconds
+            retries: Retries for connection errors and 429/5xx responses
+            backoff: Backoff factor for retries (0.5 -> 0.5s, 1s, 2s, ...)
+            cache: On-disk cache for downloaded pages
+            rate_limiter: Global limit shared with other fetchers and the search stage
+        """
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.politeness_delay = politeness_delay
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        self._host_next_start: Dict[str, float] = {}
+
+    def _host_slot(self, host: str) -> threading.Semaphore:
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_slots[host]
+
+    def _wait_turn(self, host: str) -> None:
+        """Sleep until the politeness delay since the last request to the host has passed"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._host_next_start.get(host, now))
+            self._host_next_start[host] = start + self.politeness_delay
+        if start > now:
+            time.sleep(start - now)
+
+    def fetch(self, url: str, headers: Optional[Dict[str, str]] = None, use_cache: bool = True) -> FetchResult:
+        """Fetch one URL, honouring the per-host limits and (unless use_cache is False) the cache"""
+        started = time.perf_counter()
+        cache = self.cache if use_cache else None
+        cached = None
+        if cache is not None:
+            entry = cache.get("article", url)
+            if entry is not None:
+                return FetchResult(url=url, status=200, text=entry.body, headers=entry.headers,
+                                   elapsed=time.perf_counter() - started, from_cache=True)
+            cached = cache.lookup("article", url)
+            if cached is not None:
+                headers = {**cached.validators(), **(headers or {})}
+
+        host = urlsplit(url).netloc.lower()
+        with self._host_slot(host):
+            self._wait_turn(host)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except requests.RequestException as e:
+                logging.error(f"Error fetching {url}: {str(e)}")
+                return FetchResult(url=url, error=str(e), elapsed=time.perf_counter() - started)
+
+        if cached is not None and response.status_code == 304:
+            entry = cache.revalidated(cached, dict(response.headers))
+            return FetchResult(url=url, status=200, text=entry.body, headers=entry.headers,
+                               elapsed=time.perf_counter() - started, from_cache=True)
+        if cache is not None and response.ok:
+            cache.put("article", url, response.text, dict(response.headers))
+        return FetchResult(
+            url=url,
+            status=response.status_code,
+            text=response.text,
+            headers=dict(response.headers),
+            error=None if response.ok else f"HTTP {response.status_code}",
+            elapsed=time.perf_counter() - started,
+        )
+
+    def fetch_all(self, urls: Iterable[str]) -> Iterator[FetchResult]:
+        """Fetch URLs concurrently, yielding results as they complete"""
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls)), thread_name_prefix="fetch") as executor:
+            futures = [executor.submit(self.fetch, url) for url in urls]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,144 @@
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+import yt_dlp
+from youtube_transcript_api import YouTubeTranscriptApi
+from fetch_cache import FetchCache, canonical_url
+
+# watch?v=, youtu.be/, shorts/, embed/ and live/ links all carry the same 11 character ID
+YOUTUBE_ID_PATTERN = re.compile(
+    r"(?:youtube\.com/(?:watch\?(?:.*&)?v=|shorts/|embed/|live/|v/)|youtu\.be/)([A-Za-z0-9_-]{11})"
+)
+
+def youtube_video_id(url: str) -> Optional[str]:
+    """Extract the YouTube video ID from any of its URL forms"""
+    match = YOUTUBE_ID_PATTERN.search(url)
+    return match.group(1) if match else None
+
+def media_key(url: str) -> str:
+    """Identity of a video: its YouTube ID, or the canonical URL for other hosts"""
+    return youtube_video_id(url) or canonical_url(url)
+
+@dataclass
+class MediaResult:
+    """Transcript (if any) obtained for one video"""
+    url: str
+    key: str
+    transcript: Optional[str] = None
+    source: Optional[str] = None  # "youtube_transcript" or "local"
+    audio_path: Optional[Path] = None
+
+class MediaStage:
+    """Turns video results into transcripts while downloading as little as possible.
+
+    Videos are deduplicated by ID and published transcripts are fetched first.
+    Only videos without one are downloaded, as audio only, and only when a
+    local ``transcriber`` is available. Downloads run in parallel up to
+    ``max_downloads`` across all concurrent ``process`` calls, each one
+    throttled to ``ratelimit`` bytes per second.
+    """
+
+    def __init__(
+        self,
+        audio_dir: Path,
+        cache: Optional[FetchCache] = None,
+        transcriber: Optional[Callable[[List[Path]], Dict[Path, Optional[str]]]] = None,
+        max_downloads: int = 2,
+        ratelimit: Optional[int] = None,
+        transcript_workers: int = 4,
+    ):
+        """Initialize the media stage.
+
+        Args:
+            audio_dir: Where downloaded audio files are kept
+            cache: Cache for published transcripts
+            transcriber: Transcribes a batch of audio files locally; None disables downloads
+            max_downloads: Concurrent audio downloads
+            ratelimit: Per-download bandwidth cap in bytes per second
+            transcript_workers: Concurrent transcript API requests
+        """
+        self.audio_dir = Path(audio_dir)
+        self.cache = cache
+        self.transcriber = transcriber
+        self.max_downloads = max_downloads
+        self.ratelimit = ratelimit
+        self.transcript_workers = transcript_workers
+        self._download_slots = threading.BoundedSemaphore(max(1, max_downloads))
+
+    def fetch_transcript(self, url: str) -> Optional[str]:
+        """Fetch the published YouTube transcript for a video"""
+        video_id = youtube_video_id(url)
+        if not video_id:
+            return None
+        cached = self.cache.get("transcript", url) if self.cache else None
+        if cached is not None:
+            return cached.body
+        try:
+            transcript = YouTubeTranscriptApi.get_transcript(video_id)
+        except Exception as e:
+            logging.info(f"No published transcript for {url}: {str(e)}")
+            return None
+        # Combine all transcript pieces
+        full_text = " ".join([entry["text"] for entry in transcript])
+        if self.cache:
+            self.cache.put("transcript", url, full_text)
+        return full_text
+
+    def download_audio(self, url: str) -> Optional[Path]:
+        """Download the best audio-only stream of a video, reusing an earlier download"""
+        name = re.sub(r"[^A-Za-z0-9_-]", "_", media_key(url))[-80:]
+        existing = [path for path in self.audio_dir.glob(f"{name}.*") if not path.name.endswith(".part")]
+        if existing:
+            return existing[0]
+
+        self.audio_dir.mkdir(parents=True, exist_ok=True)
+        ydl_opts = {
+            "format": "bestaudio/best",
+            "outtmpl": str(self.audio_dir / f"{name}.%(ext)s"),
+            "ratelimit": self.ratelimit,
+            "noplaylist": True,
+            "quiet": True,
+        }
+        try:
+            with self._download_slots, yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(url, download=True)
+                return Path(ydl.prepare_filename(info))
+        except Exception as e:
+            logging.error(f"Error downloading audio from {url}: {str(e)}")
+            return None
+
+    def process(self, urls: Iterable[str]) -> List[MediaResult]:
+        """Get a transcript for every distinct video, in first-seen order"""
+        results: Dict[str, MediaResult] = {}
+        for url in urls:
+            key = media_key(url)
+            if key not in results:
+                results[key] = MediaResult(url=url, key=key)
+        if not results:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.transcript_workers, len(results)), thread_name_prefix="transcript") as executor:
+            for result, transcript in zip(results.values(), executor.map(lambda r: self.fetch_transcript(r.url), results.values())):
+                if transcript:
+                    result.transcript, result.source = transcript, "youtube_transcript"
+
+        missing = [result for result in results.values() if not result.transcript]
+        logging.info(f"{len(results) - len(missing)}/{len(results)} videos have published transcripts")
+        if missing and self.transcriber is not None:
+            with ThreadPoolExecutor(max_workers=min(self.max_downloads, len(missing)), thread_name_prefix="audio") as executor:
+                for result, audio_path in zip(missing, executor.map(lambda r: self.download_audio(r.url), missing)):
+                    result.audio_path = audio_path
+
+            downloaded = [result for result in missing if result.audio_path]
+            transcripts = self.transcriber([result.audio_path for result in downloaded]) if downloaded else {}
+            for result in downloaded:
+                if transcripts.get(result.audio_path):
+                    result.transcript, result.source = transcripts[result.audio_path], "local"
+        elif missing:
+            logging.info(f"Skipping {len(missing)} videos without transcripts; local transcription is disabled")
+
+        return list(results.values())
@@ -0,0 +1,174 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+# Marks the end of a stage's input; each worker consumes exactly one
+_DONE = object()
+
+@dataclass
+class StageStats:
+    """Counters for one pipeline stage"""
+    name: str
+    workers: int
+    processed: int = 0
+    emitted: int = 0
+    errors: int = 0
+    busy_s: float = 0.0
+    max_backlog: int = 0
+    backlog_samples: int = 0
+    backlog_total: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Items processed per second of the stage's wall time"""
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mean_backlog(self) -> float:
+        return self.backlog_total / self.backlog_samples if self.backlog_samples else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "workers": self.workers,
+            "processed": self.processed,
+            "emitted": self.emitted,
+            "errors": self.errors,
+            "elapsed_s": self.elapsed,
+            "busy_s": self.busy_s,
+            "items_per_sec": self.throughput,
+            "max_backlog": self.max_backlog,
+            "mean_backlog": self.mean_backlog,
+        }
+
+class Stage:
+    """One step of a pipeline: ``func(item)`` returns an iterable of outputs for the next stage"""
+
+    def __init__(self, name: str, func: Callable[[Any], Optional[Iterable[Any]]], workers: int = 1):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+
+class Pipeline:
+    """Runs stages concurrently, connected by bounded queues.
+
+    Every stage has its own worker threads reading from the queue in front of
+    it, so downstream stages start on the first item while upstream ones are
+    still producing. Queues are bounded, so a slow stage applies backpressure
+    and memory is limited by the queue sizes rather than by the corpus.
+    A failing item is logged and counted, not fatal.
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 32):
+        """Initialize the pipeline.
+
+        Args:
+            stages: Stages in order; the last stage's outputs are yielded by run()
+            queue_size: Capacity of each queue between stages
+        """
+        self.stages = stages
+        self.queue_size = queue_size
+        self.stats = {stage.name: StageStats(stage.name, stage.workers) for stage in stages}
+
+    def run(self, source: Iterable[Any]) -> Iterator[Any]:
+        """Feed source items through every stage, yielding the final stage's outputs"""
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._feed, args=(source, queues[0]), name="pipeline-source", daemon=True)]
+        for index, stage in enumerate(self.stages):
+            remaining = [stage.workers]
+            # The last stage hands a single marker to the caller; others one per downstream worker
+            downstream = self.stages[index + 1].workers if index + 1 < len(self.stages) else 1
+            for worker in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[index], queues[index + 1], remaining, downstream),
+                    name=f"pipeline-{stage.name}-{worker}",
+                    daemon=True,
+                ))
+        for thread in threads:
+            thread.start()
+
+        output = queues[-1]
+        while True:
+            item = output.get()
+            if item is _DONE:
+                break
+            yield item
+        for thread in threads:
+            thread.join()
+
+    def _feed(self, source: Iterable[Any], out: queue.Queue) -> None:
+        try:
+            for item in source:
+                out.put(item)
+        except Exception as e:
+            logging.error(f"Pipeline source failed: {str(e)}")
+        finally:
+            for _ in range(self.stages[0].workers):
+                out.put(_DONE)
+
+    def _work(self, stage: Stage, inbox: queue.Queue, out: queue.Queue, remaining: List[int], downstream: int) -> None:
+        stats = self.stats[stage.name]
+        with stats._lock:
+            if stats.started_at is None:
+                stats.started_at = time.perf_counter()
+        try:
+            while True:
+                item = inbox.get()
+                if item is _DONE:
+                    break
+                self._process(stage, stats, item, inbox.qsize(), out)
+        finally:
+            # The last worker of a stage to finish closes the next stage's input,
+            # even if this one died, so the pipeline never hangs on a missing marker
+            with stats._lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+                if last:
+                    stats.finished_at = time.perf_counter()
+            if last:
+                for _ in range(downstream):
+                    out.put(_DONE)
+
+    def _process(self, stage: Stage, stats: StageStats, item: Any, backlog: int, out: queue.Queue) -> None:
+        started = time.perf_counter()
+        emitted = 0
+        failed = False
+        try:
+            for output in stage.func(item) or ():
+                out.put(output)
+                emitted += 1
+        except Exception as e:
+            failed = True
+            logging.error(f"Pipeline stage {stage.name} failed on an item: {str(e)}")
+        finally:
+            with stats._lock:
+                stats.processed += 1
+                stats.emitted += emitted
+                stats.errors += failed
+                stats.busy_s += time.perf_counter() - started
+                stats.backlog_samples += 1
+                stats.backlog_total += backlog
+                stats.max_backlog = max(stats.max_backlog, backlog)
+
+    def summary(self) -> str:
+        """One line per stage with throughput and backlog"""
+        lines = ["Pipeline stages:"]
+        for stats in self.stats.values():
+            lines.append(
+                f"  {stats.name}: {stats.processed} in, {stats.emitted} out, {stats.errors} errors, "
+                f"{stats.throughput:.1f} items/s over {stats.elapsed:.1f}s with {stats.workers} workers, "
+                f"backlog max {stats.max_backlog} mean {stats.mean_backlog:.1f}"
+            )
+        return "\n".join(lines)
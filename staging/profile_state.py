@@ -0,0 +1,86 @@
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+class ProfileState:
+    """Durable per-stage progress of one profile, so an interrupted run resumes.
+
+    Progress is a JSON Lines file with a ``search`` record per finished
+    (query, engine) job, a ``content`` record per extracted article or
+    transcript and a ``done`` record once the profile is written. Records are
+    fsynced as they are produced, so a crash loses only the work in flight.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.searches: Dict[Tuple[str, str], List[Dict]] = {}
+        self.content: Dict[str, Dict] = {}
+        self.profile_path: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def done(self) -> bool:
+        return self.profile_path is not None
+
+    @classmethod
+    def load(cls, path: Path) -> "ProfileState":
+        """Load recorded progress, discarding a partially written last record"""
+        state = cls(path)
+        if not state.path.exists():
+            return state
+        valid_end, terminated = 0, True
+        with open(state.path, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logging.warning(f"Discarding truncated record at {state.path}:{line_number}")
+                    break
+                valid_end += len(line)
+                terminated = line.endswith(b"\n")
+                if record["type"] == "search":
+                    state.searches[tuple(record["job"])] = record["results"]
+                elif record["type"] == "content":
+                    state.content[record["content"]["url"]] = record["content"]
+                elif record["type"] == "done":
+                    state.profile_path = record["profile_path"]
+        # New records must start on a line of their own, not extend a half-written one
+        if state.path.stat().st_size > valid_end:
+            os.truncate(state.path, valid_end)
+        if not terminated:
+            with open(state.path, 'a') as f:
+                f.write("\n")
+        return state
+
+    def reset(self) -> None:
+        """Forget all progress"""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+            self.searches, self.content, self.profile_path = {}, {}, None
+
+    def record_search(self, job: Tuple[str, str], results: List[Dict]) -> None:
+        with self._lock:
+            self._append({"type": "search", "job": list(job), "results": results})
+            self.searches[tuple(job)] = results
+
+    def record_content(self, content: Dict) -> None:
+        with self._lock:
+            self._append({"type": "content", "content": content})
+            self.content[content["url"]] = content
+
+    def record_done(self, profile_path: Path) -> None:
+        with self._lock:
+            self._append({"type": "done", "profile_path": str(profile_path)})
+            self.profile_path = str(profile_path)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a') as f:
+            # Article publish dates are datetimes
+            f.write(json.dumps(dict(record, timestamp=time.time()), default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
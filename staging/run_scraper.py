@@ -1,12 +1,77 @@
-
-from agent_profile_scraper import AgentProfileScraper
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import List
+import argparse
 import logging
+import sys
+import time
+
+# Make the repository root importable for core.tracing, used here and by agent_profile_scraper
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from agent_profile_scraper import (
+    AgentProfileScraper, create_fetch_cache, create_fetcher, create_media_stage, create_rate_limiter, load_config
+)
+from core.tracing import trace_session
+from profile_state import ProfileState
 
 # who do you want to clone?
 PROFILE_NAME = "Mahatma Gandhi Indian lawyer"
 
 
+def run_batch(names: List[str], concurrency: int, fresh: bool, config_path: str = "config.json"):
+    """Scrape several profiles in one process, sharing browsers, HTTP connections, cache, rate limit and downloads"""
+    config = load_config(config_path)
+    rate_limiter = create_rate_limiter(config)
+    cache = create_fetch_cache(config)
+    fetcher = create_fetcher(config, cache, rate_limiter)
+    media = create_media_stage(config, cache)
+
+    def scrape(name: str):
+        scraper = AgentProfileScraper(name, config_path, fetcher=fetcher, cache=cache, rate_limiter=rate_limiter, media=media)
+        skipped = not fresh and ProfileState.load(scraper.progress_path).done
+        return scraper.run(resume=not fresh), skipped
+
+    started = time.perf_counter()
+    completed, skipped, failed = [], [], []
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="profile") as executor:
+        futures = {executor.submit(scrape, name): name for name in names}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                profile_path, was_done = future.result()
+            except Exception as e:
+                logging.error(f"Profile {name} failed: {str(e)}")
+                failed.append(name)
+                continue
+            (skipped if was_done else completed).append(name)
+            print(f"[{len(completed) + len(skipped) + len(failed)}/{len(names)}] {name}: {profile_path}")
+    elapsed = time.perf_counter() - started
+
+    print(f"\nGenerated {len(completed)}/{len(names)} profiles in {elapsed:.0f}s ({len(completed) / elapsed * 3600:.1f} profiles/hour)")
+    if skipped:
+        print(f"Already generated by an earlier run: {', '.join(skipped)}")
+    if cache:
+        print(cache.summary())
+    if failed:
+        print(f"Failed: {', '.join(failed)} (rerun the same command to resume them)")
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Scrape the web and generate an agent profile")
+    parser.add_argument("--trace", help="Write a Chrome trace of the run to this file (view in Perfetto)")
+    parser.add_argument("--profile", action="store_true", help="Also capture cProfile and tracemalloc output next to the trace")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted run instead of starting over")
+    commands = parser.add_subparsers(dest="command")
+    batch = commands.add_parser("batch", help="Scrape several profiles with shared browsers, connections and rate limit")
+    batch.add_argument("names", nargs="*", help="Names of the people to profile")
+    batch.add_argument("--names-file", help="File with one name per line")
+    batch.add_argument("--concurrency", type=int, default=2, help="Profiles scraped at the same time")
+    batch.add_argument("--fresh", action="store_true", help="Ignore saved progress and start every profile over")
+    args = parser.parse_args()
+    if args.profile and not args.trace:
+        args.trace = "scraper_trace.json"
+
     # Configure logging
     logging.basicConfig(
         level=logging.INFO,
@@ -16,15 +81,26 @@ def main():
             logging.StreamHandler()
         ]
     )
-    
+
+    if args.command == "batch":
+        names = list(args.names)
+        if args.names_file:
+            names += [line.strip() for line in Path(args.names_file).read_text().splitlines() if line.strip()]
+        if not names:
+            parser.error("batch needs at least one name or --names-file")
+        with trace_session(args.trace, profile=args.profile):
+            run_batch(list(dict.fromkeys(names)), args.concurrency, args.fresh)
+        return
+
     # Initialize and run the scraper
-    scraper = AgentProfileScraper(PROFILE_NAME)
-    profile_path = scraper.run()
-    
+    with trace_session(args.trace, profile=args.profile):
+        scraper = AgentProfileScraper(PROFILE_NAME)
+        profile_path = scraper.run(resume=args.resume)
+
     print(f"\nProfile has been generated at: {profile_path}")
     print(f"\nYou can find the raw data in: raw_data/{PROFILE_NAME}")
     print(f"Processed data in: processed_data/{PROFILE_NAME}")
     print(f"And the final profile in: profiles/{PROFILE_NAME}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,136 @@
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, quote_plus, urljoin, urlsplit
+from bs4 import BeautifulSoup
+
+# date filtering if needed
+DATE_FILTER = "cdr:1,cd_min:1/1/2010,cd_max:12/31/2025"
+
+class SerpParser(ABC):
+    """Builds the results page URL of one search engine and parses its result markup.
+
+    Parsing works on HTML from either source: the raw response of a plain HTTP
+    request, or the page source of a browser that rendered the page. Engines
+    whose results only appear after JavaScript runs set ``requires_js`` so
+    they are rendered in a browser.
+    """
+
+    engine = ""
+    url_template = ""
+    result_selector = ""
+    limit = 5
+    requires_js = False
+
+    def build_url(self, query: str) -> str:
+        """Results page URL for a query; also the cache key for its parsed results"""
+        return self.url_template.format(query=quote_plus(query), date_filter=DATE_FILTER)
+
+    def parse_html(self, html: str, query: str, page_url: Optional[str] = None) -> List[Dict]:
+        """Parse the results on a page, skipping any result whose markup is incomplete"""
+        soup = BeautifulSoup(html, "html.parser")
+        results = []
+        for element in soup.select(self.result_selector)[:self.limit]:
+            try:
+                results.append(self.parse_result(element, query, page_url or self.build_url(query)))
+            except Exception as e:
+                logging.warning(f"Error extracting {self.engine} result: {str(e)}")
+        return results
+
+    @abstractmethod
+    def parse_result(self, element, query: str, page_url: str) -> Dict:
+        """Turn one result element into a result dict"""
+        pass
+
+    @staticmethod
+    def _text(element, selector: str) -> str:
+        found = element.select_one(selector)
+        if found is None:
+            raise ValueError(f"no element matching '{selector}'")
+        return found.get_text(" ", strip=True)
+
+    @staticmethod
+    def _link(element, selector: str, page_url: str) -> str:
+        found = element.select_one(selector)
+        if found is None or not found.get("href"):
+            raise ValueError(f"no link matching '{selector}'")
+        href = urljoin(page_url, found["href"])
+        # Pages served without JavaScript wrap outbound links in a /url?q= redirect
+        parts = urlsplit(href)
+        if parts.path == "/url" and "q" in parse_qs(parts.query):
+            return parse_qs(parts.query)["q"][0]
+        return href
+
+class GoogleNewsParser(SerpParser):
+    """Google News results with the date filter"""
+
+    engine = "google_news"
+    url_template = "https://www.google.com/search?q={query}&tbm=nws&tbs={date_filter}"
+    result_selector = "div.SoaBEf"
+
+    def parse_result(self, element, query: str, page_url: str) -> Dict:
+        return {
+            "type": "article",
+            "url": self._link(element, "a", page_url),
+            "title": self._text(element, "div.n0jPhd"),
+            "snippet": self._text(element, "div.GI74Re"),
+            "date": self._text(element, "div.LfVVr"),
+            "source": self.engine,
+            "query": query
+        }
+
+class GoogleParser(SerpParser):
+    """Regular Google results with the date filter"""
+
+    engine = "google"
+    url_template = "https://www.google.com/search?q={query}&tbs={date_filter}"
+    result_selector = "div.g"
+
+    def parse_result(self, element, query: str, page_url: str) -> Dict:
+        link = self._link(element, "a", page_url)
+
+        # Determine content type
+        content_type = "article"
+        if any(video_site in link.lower() for video_site in ["youtube.com", "vimeo.com"]):
+            content_type = "video"
+        elif any(social_site in link.lower() for social_site in ["twitter.com", "linkedin.com", "facebook.com"]):
+            content_type = "social"
+
+        return {
+            "type": content_type,
+            "url": link,
+            "title": self._text(element, "h3"),
+            "snippet": self._text(element, "div.VwiC3b"),
+            "source": self.engine,
+            "query": query
+        }
+
+class YouTubeParser(SerpParser):
+    """YouTube video results; rendered client-side, so they need a browser"""
+
+    engine = "youtube"
+    url_template = "https://www.youtube.com/results?search_query={query}&sp=EgIYAQ%253D%253D"
+    result_selector = "ytd-video-renderer"
+    limit = 3
+    requires_js = True
+
+    def parse_result(self, element, query: str, page_url: str) -> Dict:
+        return {
+            "type": "video",
+            "url": self._link(element, "a#video-title", page_url),
+            "title": self._text(element, "a#video-title"),
+            "channel": self._text(element, "ytd-channel-name a"),
+            "source": self.engine,
+            "query": query
+        }
+
+# Parser for each engine, in result merge order
+SERP_PARSERS: Dict[str, SerpParser] = {}
+
+def register_parser(parser: SerpParser) -> SerpParser:
+    """Add (or replace) the parser for an engine"""
+    SERP_PARSERS[parser.engine] = parser
+    return parser
+
+for _parser in (GoogleNewsParser(), GoogleParser(), YouTubeParser()):
+    register_parser(_parser)
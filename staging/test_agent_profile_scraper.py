@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+STAGING_DIR = Path(__file__).resolve().parent
+
+# A run without searches, in a fresh process so logging is configured as in a real run
+RUN_SCRIPT = """
+import agent_profile_scraper
+
+scraper = agent_profile_scraper.AgentProfileScraper("Ada Lovelace")
+scraper.search_jobs = lambda: []
+scraper.generate_profile = lambda analysis: "profile"
+scraper.run()
+"""
+
+@pytest.fixture(scope="module")
+def run_log(tmp_path_factory):
+    """scraping.log written by a scraper run"""
+    workdir = tmp_path_factory.mktemp("scraper")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(STAGING_DIR), str(STAGING_DIR.parent)]))
+    subprocess.run([sys.executable, "-c", RUN_SCRIPT], cwd=workdir, env=env, check=True, capture_output=True)
+    return (workdir / "scraping.log").read_text()
+
+def test_cache_summary_reaches_the_log(run_log):
+    assert "INFO - Fetch cache hit rate" in run_log
+
+def test_pipeline_stage_summary_reaches_the_log(run_log):
+    assert "INFO - Pipeline stages:" in run_log
+    assert "  analyze: 0 in, 0 out, 0 errors" in run_log
+
+def test_near_duplicate_summary_reaches_the_log(run_log):
+    assert "INFO - Near-duplicate filter (Jaccard >= 0.8" in run_log
+
+def test_analysis_reuse_summary_reaches_the_log(run_log):
+    assert "INFO - Analyzed 0 new or changed sources, reused 0 stored analyses" in run_log
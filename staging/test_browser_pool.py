@@ -0,0 +1,50 @@
+import threading
+import pytest
+from selenium.common.exceptions import WebDriverException
+from browser_pool import BrowserPool
+
+class FakeDriver:
+    def quit(self):
+        pass
+
+class FakePool(BrowserPool):
+    def __init__(self, size: int):
+        super().__init__(size)
+        self.started = 0
+
+    def _create_driver(self):
+        self.started += 1
+        return FakeDriver()
+
+def test_waiting_borrower_replaces_a_crashed_driver():
+    pool = FakePool(size=1)
+    borrowed = threading.Event()
+    results = []
+
+    def crash():
+        with pytest.raises(WebDriverException):
+            with pool.driver():
+                borrowed.set()
+                waiter.join(0.2)  # give the waiter time to block on the full pool
+                raise WebDriverException("browser crashed")
+
+    def wait_for_driver():
+        borrowed.wait()
+        with pool.driver() as driver:
+            results.append(driver)
+
+    waiter = threading.Thread(target=wait_for_driver)
+    waiter.start()
+    crash()
+    waiter.join(5)
+
+    assert not waiter.is_alive() and len(results) == 1
+    assert pool.started == 2
+
+def test_returned_driver_is_reused():
+    pool = FakePool(size=2)
+    with pool.driver() as first:
+        pass
+    with pool.driver() as second:
+        assert second is first
+    assert pool.started == 1
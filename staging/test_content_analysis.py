@@ -0,0 +1,73 @@
+from content_analysis import ANALYSIS_PATTERNS, AnalysisStore, ContentAnalyzer, analyze_content
+
+def test_prefix_patterns_tag_every_category_they_belong_to():
+    analysis = analyze_content([{"text": "He is characteristically calm under pressure. Known for his\n  TIPS!"}])
+
+    assert analysis["behaviors"] == ["He is characteristically calm under pressure", "Known for his TIPS"]
+    # "character" (tone) is a prefix of "characteristically" (behaviors)
+    assert analysis["tone"] == ["He is characteristically calm under pressure"]
+    assert analysis["practical_advice"] == ["Known for his TIPS"]
+
+def test_item_fields_short_sentences_and_defaults_match_the_original_rules():
+    analysis = analyze_content([
+        {"text": "", "snippet": "She always wants to win big."},
+        {"snippet": "She always wants to win big"},
+        {"title": "Always on"},
+    ])
+
+    assert analysis["goals"] == ["She always wants to win big"]
+    assert analysis["behaviors"] == ["She always wants to win big"]
+    assert analysis["tone"] == ["No specific tone identified in the content."]
+
+def test_parallel_analysis_matches_serial():
+    content = [{"text": f"Item {i} faces a real challenge. It values honest advice from peers."} for i in range(200)]
+
+    assert analyze_content(content, workers=2, chunk_size=16) == analyze_content(content)
+
+def test_merge_combines_partial_results():
+    left = ContentAnalyzer().add_all([{"text": "They always share the lesson learned"}])
+    right = ContentAnalyzer().add_all([{"text": "The mission is to simplify payments"}])
+
+    merged = left.merge(right.sentences).result()
+
+    assert merged["goals"] == ["The mission is to simplify payments"]
+    assert merged["practical_advice"] == ["They always share the lesson learned"]
+
+def test_store_only_analyzes_new_sources_and_merges_to_the_full_result(tmp_path):
+    week_one = [{"url": f"http://a/{i}", "text": f"Source {i} always shares a lesson. It values grit."} for i in range(5)]
+    week_two = week_one + [{"url": "http://a/new", "text": "A new interview: the mission is to fix hiring."}]
+    store = AnalysisStore(tmp_path)
+    for item in week_one:
+        store.analyze(item)
+    store.save()
+
+    rerun = AnalysisStore(tmp_path)
+    analyzer = ContentAnalyzer()
+    for item in week_two:
+        analyzer.merge(rerun.analyze(item))
+
+    assert (rerun.analyzed, rerun.reused) == (1, 5)
+    assert analyzer.result() == analyze_content(week_two)
+
+def test_store_drops_results_of_a_changed_source(tmp_path):
+    store = AnalysisStore(tmp_path)
+    store.analyze({"url": "http://a/1", "text": "They always share the lesson learned"})
+    store.analyze({"url": "http://a/2", "text": "The mission is to simplify payments"})
+    store.save()
+
+    rerun = AnalysisStore(tmp_path)
+    changed = {"url": "http://a/1", "text": "They value honest feedback"}
+    analyzer = ContentAnalyzer().merge(rerun.analyze(changed))
+    rerun.save()
+
+    assert analyzer.result() == analyze_content([changed])
+    assert rerun.removed == 1
+    assert len(list(tmp_path.glob("*.json"))) == 3  # two current sources and the index
+
+def test_store_ignores_results_made_with_other_patterns(tmp_path):
+    AnalysisStore(tmp_path).analyze({"text": "They always share the lesson learned"})
+
+    changed = AnalysisStore(tmp_path, {**ANALYSIS_PATTERNS, "tone": ["learned"]})
+
+    assert changed.analyze({"text": "They always share the lesson learned"})["tone"] == ["They always share the lesson learned"]
+    assert changed.analyzed == 1
@@ -0,0 +1,33 @@
+import random
+from dedup import NearDuplicateFilter, optimal_bands
+
+WORDS = "market founder capital strategy growth team product customer revenue vision board launch".split()
+
+def _article(rng: random.Random, words: int = 400) -> str:
+    return " ".join(f"{rng.choice(WORDS)}{rng.randint(0, 30)}" for _ in range(words))
+
+def test_band_parameters_fit_the_signature_and_shift_with_threshold():
+    bands, rows = optimal_bands(0.8, 128)
+    assert bands * rows <= 128
+    assert optimal_bands(0.5, 128)[1] < rows
+
+def test_syndicated_copies_are_dropped_and_distinct_texts_kept():
+    rng = random.Random(3)
+    story = _article(rng)
+    words = story.split()
+    # Same wire story with a different outlet footer and a couple of edits
+    words[10], words[200] = "Reuters", "edited"
+    syndicated = " ".join(words) + " Copyright Example Times"
+    duplicates = NearDuplicateFilter(threshold=0.8)
+
+    assert duplicates.check("wire", story) is None
+    assert duplicates.check("outlet", syndicated) == "wire"
+    assert duplicates.check("other", _article(rng)) is None
+    assert (duplicates.checked, duplicates.dropped) == (3, 1)
+    assert "dropped 1/3 texts" in duplicates.summary()
+
+def test_empty_text_is_never_a_duplicate():
+    duplicates = NearDuplicateFilter()
+
+    assert duplicates.check("a", "") is None
+    assert duplicates.check("b", "") is None
@@ -0,0 +1,135 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from fetch_cache import FetchCache, canonical_url
+from fetcher import ArticleFetcher
+
+class FixtureServer:
+    """Local HTTP server with slow, flaky and static article pages"""
+
+    def __init__(self, delay: float = 0.2):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.request_times = []
+        self.hits = {}
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                    server.request_times.append(time.monotonic())
+                    hits = server.hits[self.path] = server.hits.get(self.path, 0) + 1
+                try:
+                    time.sleep(server.delay)
+                    if self.path.startswith("/flaky") and hits == 1:
+                        self.send_response(503)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    if self.path.startswith("/etag") and self.headers.get("If-None-Match") == '"v1"':
+                        self.send_response(304)
+                        self.send_header("ETag", '"v1"')
+                        self.end_headers()
+                        return
+                    if self.path.startswith("/missing"):
+                        self.send_response(404)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    body = f"<html><head><title>{self.path}</title></head><body><p>Article {self.path}</p></body></html>".encode()
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/html")
+                    self.send_header("ETag", '"v1"')
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+        return Handler
+
+@pytest.fixture
+def fixture_server():
+    server = FixtureServer()
+    thread = threading.Thread(target=server.httpd.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+def test_fetch_all_downloads_concurrently_within_per_host_cap(fixture_server):
+    fetcher = ArticleFetcher(max_workers=8, per_host=3, politeness_delay=0.0)
+    urls = [f"{fixture_server.url}/article/{i}" for i in range(6)]
+
+    started = time.perf_counter()
+    results = list(fetcher.fetch_all(urls))
+    elapsed = time.perf_counter() - started
+
+    assert sorted(result.url for result in results) == sorted(urls)
+    assert all(result.ok and f"Article /article/" in result.text for result in results)
+    assert fixture_server.max_in_flight == 3
+    # Two waves of three instead of six sequential requests
+    assert elapsed < 6 * fixture_server.delay
+
+def test_politeness_delay_spaces_requests_to_a_host(fixture_server):
+    fixture_server.delay = 0.0
+    fetcher = ArticleFetcher(max_workers=4, per_host=4, politeness_delay=0.1)
+
+    list(fetcher.fetch_all(f"{fixture_server.url}/article/{i}" for i in range(4)))
+
+    gaps = [b - a for a, b in zip(fixture_server.request_times, fixture_server.request_times[1:])]
+    assert min(gaps) >= 0.09
+
+def test_retryable_status_is_retried_with_backoff(fixture_server):
+    fetcher = ArticleFetcher(politeness_delay=0.0, retries=2, backoff=0.01)
+
+    result = fetcher.fetch(f"{fixture_server.url}/flaky")
+
+    assert result.ok
+    assert fixture_server.hits["/flaky"] == 2
+
+def test_errors_and_timeouts_are_reported_not_raised(fixture_server):
+    missing = ArticleFetcher(politeness_delay=0.0, retries=0).fetch(f"{fixture_server.url}/missing")
+    slow = ArticleFetcher(politeness_delay=0.0, timeout=0.05, retries=0).fetch(f"{fixture_server.url}/article/slow")
+
+    assert not missing.ok and missing.status == 404
+    assert not slow.ok and slow.error
+
+def test_cache_serves_fresh_pages_and_revalidates_stale_ones(fixture_server, tmp_path):
+    fixture_server.delay = 0.0
+    cache = FetchCache(tmp_path, ttls={"article": 60})
+    fetcher = ArticleFetcher(politeness_delay=0.0, cache=cache)
+    url = f"{fixture_server.url}/etag/1"
+
+    first = fetcher.fetch(url)
+    second = fetcher.fetch(f"{url}?utm_source=newsletter")
+    assert first.ok and not first.from_cache
+    assert second.from_cache and second.text == first.text
+    assert fixture_server.hits["/etag/1"] == 1
+
+    cache.ttls["article"] = 0
+    third = fetcher.fetch(url)
+    assert third.ok and third.from_cache and third.text == first.text
+    assert fixture_server.hits["/etag/1"] == 2
+    assert cache.stats["article"] == {"hits": 1, "revalidated": 1, "misses": 1}
+
+def test_canonical_url_ignores_tracking_params_order_and_fragment():
+    assert canonical_url("HTTPS://Example.com:443/a?b=2&a=1&utm_medium=x&fbclid=y#top") == "https://example.com/a?a=1&b=2"
+    assert canonical_url("http://example.com") == "http://example.com/"
@@ -0,0 +1,54 @@
+from pathlib import Path
+import pytest
+from media import MediaStage, media_key
+
+@pytest.mark.parametrize("url", [
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42",
+    "https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+    "https://youtu.be/dQw4w9WgXcQ?si=abc",
+    "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+    "https://www.youtube.com/embed/dQw4w9WgXcQ",
+])
+def test_media_key_matches_every_youtube_url_form(url):
+    assert media_key(url) == "dQw4w9WgXcQ"
+
+class RecordingStage(MediaStage):
+    """Media stage with the network calls replaced by canned answers"""
+
+    def __init__(self, transcripts, transcriber=None):
+        super().__init__(Path("unused"), transcriber=transcriber)
+        self.transcripts = transcripts
+        self.transcript_requests = []
+        self.downloads = []
+
+    def fetch_transcript(self, url):
+        self.transcript_requests.append(url)
+        return self.transcripts.get(media_key(url))
+
+    def download_audio(self, url):
+        self.downloads.append(url)
+        return Path(f"{media_key(url)}.m4a")
+
+def test_transcripts_are_fetched_once_per_video_before_any_download():
+    stage = RecordingStage({"aaaaaaaaaaa": "published"}, transcriber=lambda paths: {path: f"local {path.stem}" for path in paths})
+
+    results = stage.process([
+        "https://www.youtube.com/watch?v=aaaaaaaaaaa",
+        "https://youtu.be/aaaaaaaaaaa",
+        "https://www.youtube.com/watch?v=bbbbbbbbbbb",
+    ])
+
+    assert len(stage.transcript_requests) == 2
+    assert stage.downloads == ["https://www.youtube.com/watch?v=bbbbbbbbbbb"]
+    assert [(r.key, r.transcript, r.source) for r in results] == [
+        ("aaaaaaaaaaa", "published", "youtube_transcript"),
+        ("bbbbbbbbbbb", "local bbbbbbbbbbb", "local"),
+    ]
+
+def test_nothing_is_downloaded_without_a_local_transcriber():
+    stage = RecordingStage({})
+
+    results = stage.process(["https://www.youtube.com/watch?v=ccccccccccc"])
+
+    assert stage.downloads == []
+    assert results[0].transcript is None
@@ -0,0 +1,46 @@
+import threading
+import time
+from pipeline import Pipeline, Stage
+
+def test_every_item_flows_through_multi_worker_stages():
+    pipeline = Pipeline([
+        Stage("split", lambda n: range(n), workers=3),
+        Stage("square", lambda n: [n * n], workers=4),
+    ], queue_size=2)
+
+    outputs = sorted(pipeline.run([1, 2, 3, 4]))
+
+    assert outputs == sorted(n * n for count in (1, 2, 3, 4) for n in range(count))
+    assert pipeline.stats["split"].processed == 4
+    assert pipeline.stats["square"].processed == pipeline.stats["split"].emitted == 10
+
+def test_downstream_starts_before_upstream_finishes():
+    first_output = threading.Event()
+    upstream_done = []
+
+    def slow_source(n):
+        if n == 4:
+            first_output.wait(timeout=2)
+            upstream_done.append(time.perf_counter())
+        yield n
+
+    pipeline = Pipeline([Stage("produce", slow_source), Stage("consume", lambda n: [n])], queue_size=1)
+    seen = []
+    for item in pipeline.run(range(5)):
+        seen.append((item, time.perf_counter()))
+        first_output.set()
+
+    assert sorted(item for item, _ in seen) == [0, 1, 2, 3, 4]
+    assert seen[0][1] < upstream_done[0]
+
+def test_failing_items_are_counted_and_skipped():
+    def fragile(n):
+        if n % 2:
+            raise ValueError("odd")
+        return [n]
+
+    pipeline = Pipeline([Stage("fragile", fragile, workers=2)])
+
+    assert sorted(pipeline.run(range(6))) == [0, 2, 4]
+    assert pipeline.stats["fragile"].errors == 3
+    assert "fragile: 6 in, 3 out, 3 errors" in pipeline.summary()
@@ -0,0 +1,32 @@
+from datetime import datetime
+from profile_state import ProfileState
+
+def test_progress_survives_a_reload_and_a_truncated_last_record(tmp_path):
+    path = tmp_path / "progress.jsonl"
+    state = ProfileState.load(path)
+    state.record_search(("Ada interview", "google"), [{"type": "article", "url": "http://a"}])
+    state.record_content({"url": "http://a", "text": "Ada always asks why", "publish_date": datetime(2024, 1, 2)})
+    with open(path, "a") as f:
+        f.write('{"type": "content", "content": {"url": "http://b"')
+
+    resumed = ProfileState.load(path)
+
+    assert resumed.searches == {("Ada interview", "google"): [{"type": "article", "url": "http://a"}]}
+    assert list(resumed.content) == ["http://a"]
+    assert resumed.content["http://a"]["publish_date"] == "2024-01-02 00:00:00"
+    assert not resumed.done
+
+    # Progress recorded after the truncation is kept on the next reload
+    resumed.record_content({"url": "http://b", "text": "Ada reads the notes"})
+    resumed.record_search(("Ada career", "google"), [])
+    reloaded = ProfileState.load(path)
+    assert list(reloaded.content) == ["http://a", "http://b"]
+    assert ("Ada career", "google") in reloaded.searches
+
+def test_done_and_reset(tmp_path):
+    state = ProfileState.load(tmp_path / "progress.jsonl")
+    state.record_done(tmp_path / "profile.md")
+    assert ProfileState.load(state.path).done
+
+    state.reset()
+    assert not state.path.exists() and not ProfileState.load(state.path).done
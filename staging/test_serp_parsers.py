@@ -0,0 +1,61 @@
+from pathlib import Path
+from serp_parsers import DATE_FILTER, SERP_PARSERS
+
+FIXTURES = Path(__file__).parent / "fixtures" / "serp"
+QUERY = "Ada Lovelace interview biography"
+
+def parse_fixture(engine: str):
+    return SERP_PARSERS[engine].parse_html((FIXTURES / f"{engine}.html").read_text(), QUERY)
+
+def test_build_url_encodes_query_and_date_filter():
+    url = SERP_PARSERS["google_news"].build_url("Ada Lovelace & Babbage")
+    assert url.startswith("https://www.google.com/search?q=Ada+Lovelace+%26+Babbage&tbm=nws")
+    assert url.endswith(f"&tbs={DATE_FILTER}")
+
+def test_google_results_skip_incomplete_markup_and_classify_links():
+    results = parse_fixture("google")
+    # The result without a snippet is skipped, but it still counts towards the limit of 5
+    assert [result["url"] for result in results] == [
+        "https://www.biography.com/scientists/ada-lovelace",
+        "https://www.youtube.com/watch?v=abcdefghijk",
+        "https://twitter.com/adalovelace",
+        "https://www.britannica.com/biography/Ada-Lovelace",
+    ]
+    assert [result["type"] for result in results] == ["article", "video", "social", "article"]
+    assert results[0] == {
+        "type": "article",
+        "url": "https://www.biography.com/scientists/ada-lovelace",
+        "title": "Ada Lovelace - Biography",
+        "snippet": "Ada Lovelace was an English mathematician and writer.",
+        "source": "google",
+        "query": QUERY,
+    }
+
+def test_google_news_results():
+    results = parse_fixture("google_news")
+    assert len(results) == 2
+    assert results[1] == {
+        "type": "article",
+        "url": "https://www.theguardian.com/science/ada-lovelace-letters",
+        "title": "Ada Lovelace's letters go on display",
+        "snippet": "Correspondence with Charles Babbage reveals her vision for the Analytical Engine.",
+        "date": "12 Mar 2024",
+        "source": "google_news",
+        "query": QUERY,
+    }
+
+def test_youtube_results_resolve_relative_links():
+    assert SERP_PARSERS["youtube"].requires_js and not SERP_PARSERS["google"].requires_js
+    results = parse_fixture("youtube")
+    assert len(results) == 3
+    assert results[0] == {
+        "type": "video",
+        "url": "https://www.youtube.com/watch?v=AAAAAAAAAAA&pp=ygUU",
+        "title": "Ada Lovelace: The First Programmer",
+        "channel": "History Hub",
+        "source": "youtube",
+        "query": QUERY,
+    }
+
+def test_unrendered_page_has_no_results():
+    assert SERP_PARSERS["youtube"].parse_html("<html><body><div id='content'></div></body></html>", QUERY) == []
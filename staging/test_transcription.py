@@ -0,0 +1,46 @@
+import json
+import sys
+import types
+from concurrent.futures import Future
+import numpy as np
+from transcription import SAMPLE_RATE, TranscriptionService, audio_hash, split_audio
+
+def test_split_audio_covers_every_sample_in_order():
+    audio = np.arange(int(2.5 * SAMPLE_RATE), dtype=np.float32)
+
+    chunks = split_audio(audio, chunk_seconds=1)
+
+    assert [len(chunk) for chunk in chunks] == [SAMPLE_RATE, SAMPLE_RATE, SAMPLE_RATE // 2]
+    assert np.array_equal(np.concatenate(chunks), audio)
+
+def test_cached_transcripts_are_reused_without_starting_workers(tmp_path):
+    audio_path = tmp_path / "talk.m4a"
+    audio_path.write_bytes(b"not really audio")
+    service = TranscriptionService(tmp_path / "cache", model_name="base", workers=2)
+    (tmp_path / "cache").mkdir()
+    (tmp_path / "cache" / f"{audio_hash(audio_path)}.base.json").write_text(json.dumps({"text": "hello"}))
+
+    assert service.transcribe([audio_path]) == {audio_path: "hello"}
+    assert service._executor is None
+
+def test_real_time_factor_excludes_time_queued_behind_earlier_files(tmp_path, monkeypatch):
+    paths = [tmp_path / f"talk{i}.m4a" for i in range(2)]
+    for i, path in enumerate(paths):
+        path.write_bytes(bytes([i]))
+    monkeypatch.setitem(sys.modules, "whisper", types.SimpleNamespace(load_audio=lambda path: np.zeros(10 * SAMPLE_RATE)))
+    # The second file's only chunk starts 100s after it was submitted and runs for 5s
+    timings = iter([("first", 1000.0, 1005.0), ("second", 1100.0, 1105.0)])
+
+    class Pool:
+        def submit(self, func, chunk):
+            future = Future()
+            future.set_result(next(timings))
+            return future
+
+    service = TranscriptionService(tmp_path / "cache", workers=1, chunk_seconds=30)
+    monkeypatch.setattr(service, "_pool", lambda: Pool())
+
+    assert service.transcribe(paths) == {paths[0]: "first", paths[1]: "second"}
+    record = json.loads(service._cache_path(audio_hash(paths[1])).read_text())
+    assert record["elapsed_s"] == 5.0 and record["real_time_factor"] == 0.5
+    assert not list((tmp_path / "cache").glob("*.tmp"))
@@ -0,0 +1,157 @@
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+# Whisper resamples everything to 16 kHz mono
+SAMPLE_RATE = 16000
+
+# Model loaded once by each worker process
+_worker_model = None
+
+def _init_worker(model_name: str, threads: int) -> None:
+    """Load the Whisper model once per worker process"""
+    global _worker_model
+    import torch
+    import whisper
+    # Workers split the cores between them instead of each using all of them
+    torch.set_num_threads(threads)
+    _worker_model = whisper.load_model(model_name)
+
+def _transcribe_chunk(audio: np.ndarray) -> Tuple[str, float, float]:
+    """Transcribe one chunk, returning its text with wall-clock start and end times"""
+    started = time.time()
+    text = _worker_model.transcribe(audio, fp16=False)["text"].strip()
+    return text, started, time.time()
+
+def audio_hash(path: Path) -> str:
+    """SHA-256 of an audio file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def split_audio(audio: np.ndarray, chunk_seconds: float) -> List[np.ndarray]:
+    """Split 16 kHz samples into consecutive chunks of at most chunk_seconds"""
+    size = max(1, int(chunk_seconds * SAMPLE_RATE))
+    return [audio[start:start + size] for start in range(0, len(audio), size)] or [audio]
+
+class TranscriptionService:
+    """Local Whisper transcription spread over a pool of worker processes.
+
+    Each worker loads the model once at startup. Audio files are decoded and
+    cut into fixed-length chunks that are transcribed in parallel across the
+    workers, then stitched back together in order. Finished transcripts are
+    cached by audio hash so the same recording is never transcribed twice.
+    """
+
+    def __init__(self, cache_dir: Path, model_name: str = "base", workers: Optional[int] = None, chunk_seconds: float = 30.0):
+        """Initialize the service.
+
+        Args:
+            cache_dir: Directory for transcripts keyed by audio hash
+            model_name: Whisper model to load in every worker
+            workers: Worker processes (defaults to the number of CPUs)
+            chunk_seconds: Length of the audio chunks transcribed in parallel
+        """
+        self.cache_dir = Path(cache_dir)
+        self.model_name = model_name
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_seconds = chunk_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                threads = max(1, (os.cpu_count() or 1) // self.workers)
+                logging.info(f"Starting {self.workers} Whisper workers with the {self.model_name} model")
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_worker,
+                    initargs=(self.model_name, threads),
+                )
+            return self._executor
+
+    def _cache_path(self, digest: str) -> Path:
+        return self.cache_dir / f"{digest}.{self.model_name}.json"
+
+    def _write_cache(self, digest: str, record: Dict) -> None:
+        """Write a transcript atomically, so an interrupted run never leaves a truncated entry"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._cache_path(digest)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(record))
+        os.replace(tmp, path)
+
+    def transcribe(self, audio_paths: List[Path]) -> Dict[Path, Optional[str]]:
+        """Transcribe audio files, returning their text by path (None on failure)"""
+        transcripts: Dict[Path, Optional[str]] = {}
+        pending = []
+        for path in audio_paths:
+            try:
+                digest = audio_hash(path)
+                cache_path = self._cache_path(digest)
+                if cache_path.exists():
+                    transcripts[path] = json.loads(cache_path.read_text())["text"]
+                    logging.info(f"Using cached transcript for {path}")
+                    continue
+                import whisper
+                audio = whisper.load_audio(str(path))
+            except Exception as e:
+                logging.error(f"Error loading audio {path}: {str(e)}")
+                transcripts[path] = None
+                continue
+            # Submit every chunk of every file up front so all workers stay busy
+            futures = [self._pool().submit(_transcribe_chunk, chunk) for chunk in split_audio(audio, self.chunk_seconds)]
+            pending.append((path, digest, len(audio) / SAMPLE_RATE, futures))
+
+        for path, digest, duration, futures in pending:
+            try:
+                parts = [future.result() for future in futures]
+            except Exception as e:
+                logging.error(f"Error transcribing {path}: {str(e)}")
+                transcripts[path] = None
+                continue
+            text = " ".join(part for part, _, _ in parts if part)
+            # Timed from the file's first chunk starting, not from when it was queued behind earlier files
+            elapsed = max(finished for _, _, finished in parts) - min(started for _, started, _ in parts)
+            rtf = elapsed / duration if duration else 0.0
+            logging.info(f"Transcribed {path.name}: {duration:.0f}s of audio in {elapsed:.1f}s (real-time factor {rtf:.2f})")
+            self._write_cache(digest, {
+                "text": text,
+                "model": self.model_name,
+                "duration_s": duration,
+                "elapsed_s": elapsed,
+                "real_time_factor": rtf,
+                "source": str(path),
+            })
+            transcripts[path] = text
+        return transcripts
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+_service: Optional[TranscriptionService] = None
+_service_lock = threading.Lock()
+
+def get_transcription_service(cache_dir: Path, model_name: str = "base", workers: Optional[int] = None, chunk_seconds: float = 30.0) -> TranscriptionService:
+    """Return the process-wide transcription service, creating it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = TranscriptionService(cache_dir, model_name, workers, chunk_seconds)
+            atexit.register(_service.close)
+        return _service
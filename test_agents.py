@@ -5,7 +5,9 @@ from agents.product_owner.agent import ProductOwnerAgent
 from agents.cto.agent import CTOAgent
 from utils.config import settings
 from core.knowledge_base.knowledge_manager import KnowledgeManager
+from core.cassette import activate_cassette
 from pathlib import Path
+from typing import Annotated, Optional
 
 app = typer.Typer()
 console = Console()
@@ -100,12 +102,18 @@ def test_agent_communication():
         console.print("\n" + "="*80 + "\n")
 
 @app.command()
-def test():
+def test(
+    cassette: Annotated[Optional[Path], typer.Option(help="Record LLM calls to, or replay them from, this cassette file")] = None,
+    cassette_mode: Annotated[str, typer.Option(help="Cassette mode: 'record' or 'replay'")] = "replay",
+    replay_timing: Annotated[bool, typer.Option(help="Emulate the recorded LLM timing when replaying")] = False
+):
     """Run tests to verify LLM setup and agent communication"""
     console.print("[bold]Starting Agent System Tests[/bold]\n")
+    if cassette:
+        activate_cassette(cassette, cassette_mode, replay_timing)
     
-    # Test Ollama connection
-    if not test_ollama_connection():
+    # Test Ollama connection (not needed when replaying a cassette)
+    if not (cassette and cassette_mode == "replay") and not test_ollama_connection():
         console.print("\n[yellow]Please make sure Ollama is installed and running:[/yellow]")
         console.print("1. Install Ollama from https://ollama.ai")
         console.print("2. Run 'ollama serve' in a terminal")
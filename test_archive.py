@@ -0,0 +1,86 @@
+import time
+from datetime import date, datetime, timezone
+
+import pyarrow.parquet as pq
+import pytest
+
+from core.archive import TranscriptArchive, compact, latency_stats, scan, turn_record
+
+def _turn(iteration: int, agent: str, duration: float, day: int) -> dict:
+    return {
+        "iteration": iteration,
+        "agent": agent,
+        "from_agent": "CTO" if agent == "Product Owner" else "Product Owner",
+        "prompt": "How should we export data?",
+        "response": "Use a nightly batch export." * (iteration + 1),
+        "retrieved": ["export.md"],
+        "attempts": 1,
+        "duration_s": duration,
+        "timestamp": datetime(2026, 10, day, 12, tzinfo=timezone.utc).timestamp(),
+    }
+
+def test_batched_writes_are_partitioned_by_day(tmp_path):
+    archive = TranscriptArchive(tmp_path, batch_size=4)
+    for iteration in range(3):
+        archive.append(turn_record("s1", _turn(iteration, "CTO", 1.0, 1), "llama3.3:latest"))
+    assert not list(tmp_path.rglob("*.parquet"))
+
+    archive.append(turn_record("s1", _turn(3, "CTO", 1.0, 2), "llama3.3:latest"))
+    assert sorted(path.parent.name for path in tmp_path.rglob("*.parquet")) == ["date=2026-10-01", "date=2026-10-02"]
+
+    table = scan(tmp_path, columns=["session_id", "retrieved", "response_tokens"], since=date(2026, 10, 2))
+    assert table.to_pylist() == [{"session_id": "s1", "retrieved": ["export.md"], "response_tokens": 27}]
+
+def test_latency_stats_by_agent_and_model(tmp_path):
+    archive = TranscriptArchive(tmp_path)
+    for iteration in range(100):
+        archive.append(turn_record("s1", _turn(iteration, "CTO", 1.0 + iteration / 100, 1), "llama3.3:latest"))
+        archive.append(turn_record("s1", _turn(iteration, "Product Owner", 0.5, 1), "llama3.3:latest"))
+    archive.close()
+    # A write that never finished must not break scans
+    (tmp_path / "date=2026-10-01" / ".part-unfinished.parquet.tmp").write_bytes(b"PAR1")
+
+    stats = {row["agent"]: row for row in latency_stats(tmp_path)}
+    assert stats["CTO"]["turns"] == 100 and stats["CTO"]["model"] == "llama3.3:latest"
+    assert abs(stats["CTO"]["p50"] - 1.5) < 0.02 and abs(stats["CTO"]["p95"] - 1.94) < 0.02
+    assert stats["Product Owner"]["p95"] == 0.5
+    assert latency_stats(tmp_path, since=date(2026, 10, 2)) == []
+
+def test_compact_merges_finished_days(tmp_path):
+    archive = TranscriptArchive(tmp_path, batch_size=1)
+    for iteration in range(3):
+        archive.append(turn_record("s1", _turn(iteration, "CTO", 1.0, 1)))
+    assert compact(tmp_path, before=date(2026, 10, 1)) == 0
+    assert compact(tmp_path, before=date(2026, 10, 2)) == 1
+
+    files = list(tmp_path.rglob("*.parquet"))
+    assert len(files) == 1 and pq.read_table(files[0]).num_rows == 3
+    assert scan(tmp_path, columns=["iteration"])["iteration"].to_pylist() == [0, 1, 2]
+
+def test_partial_batch_is_written_after_the_flush_interval(tmp_path):
+    archive = TranscriptArchive(tmp_path, flush_interval=0.1)
+    archive.append(turn_record("s1", _turn(0, "CTO", 1.0, 1)))
+    deadline = time.monotonic() + 5
+    while not list(tmp_path.rglob("*.parquet")) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    archive.close()
+    assert scan(tmp_path, columns=["iteration"]).num_rows == 1
+
+def test_failed_flush_requeues_only_unwritten_days(tmp_path, monkeypatch):
+    archive = TranscriptArchive(tmp_path)
+    for day in (1, 2):
+        archive.append(turn_record("s1", _turn(day, "CTO", 1.0, day)))
+    write = archive._write
+
+    def fail_second_day(day, rows):
+        if day == "2026-10-02":
+            raise OSError("disk full")
+        return write(day, rows)
+
+    monkeypatch.setattr(archive, "_write", fail_second_day)
+    with pytest.raises(OSError):
+        archive.flush()
+    monkeypatch.setattr(archive, "_write", write)
+    archive.close()
+
+    assert sorted(scan(tmp_path, columns=["iteration"])["iteration"].to_pylist()) == [1, 2]
@@ -0,0 +1,33 @@
+import pytest
+
+from agents.cto.agent import CTOAgent
+from benchmarks.fake_ollama import FakeOllamaServer
+from core.cassette import CassetteMissError, activate_cassette
+from utils.config import settings
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    yield tmp_path / "cassette.jsonl"
+    activate_cassette(None)
+
+def test_replay_serves_recorded_responses_without_a_model(cassette_path, monkeypatch):
+    with FakeOllamaServer(response_text="Ship the export as a nightly batch job.") as server:
+        monkeypatch.setattr(settings, "OLLAMA_API_URL", server.url)
+        activate_cassette(cassette_path, "record")
+        recorded = CTOAgent().process_message("How should we export data?", from_agent="Product Owner")
+        assert server.request_count == 1
+
+    activate_cassette(cassette_path, "replay")
+    replayed = CTOAgent().process_message("How should we export data?", from_agent="Product Owner")
+
+    assert replayed == recorded == "Ship the export as a nightly batch job."
+
+def test_replay_of_a_changed_prompt_raises_a_miss(cassette_path, monkeypatch):
+    with FakeOllamaServer() as server:
+        monkeypatch.setattr(settings, "OLLAMA_API_URL", server.url)
+        activate_cassette(cassette_path, "record")
+        CTOAgent().process_message("How should we export data?")
+
+    activate_cassette(cassette_path, "replay")
+    with pytest.raises(CassetteMissError):
+        CTOAgent().process_message("How should we import data?")
@@ -0,0 +1,28 @@
+from core.checkpoint import SessionCheckpoint
+
+def _turn(iteration: int) -> dict:
+    return {"iteration": iteration, "agent": "CTO", "prompt": "p", "response": f"r{iteration}",
+            "state": {"current_agent": "Product Owner", "other_agent": "CTO"}}
+
+def test_records_appended_after_a_truncated_record_survive_a_reload(tmp_path):
+    checkpoint = SessionCheckpoint.create(tmp_path, "Design an export", 10, session_id="s1")
+    checkpoint.record_turn(_turn(0))
+    with open(checkpoint.path, "a") as f:
+        f.write('{"type": "turn", "iteration": 1, "resp')
+
+    resumed = SessionCheckpoint.load(tmp_path, "s1")
+    assert [turn["iteration"] for turn in resumed.turns] == [0]
+    resumed.record_turn(_turn(1))
+    resumed.record_turn(_turn(2))
+
+    assert [turn["iteration"] for turn in SessionCheckpoint.load(tmp_path, "s1").turns] == [0, 1, 2]
+
+def test_complete_record_missing_its_newline_is_kept(tmp_path):
+    checkpoint = SessionCheckpoint.create(tmp_path, "Design an export", 10, session_id="s1")
+    checkpoint.record_turn(_turn(0))
+    checkpoint.path.write_text(checkpoint.path.read_text().rstrip("\n"))
+
+    resumed = SessionCheckpoint.load(tmp_path, "s1")
+    resumed.record_turn(_turn(1))
+
+    assert [turn["iteration"] for turn in SessionCheckpoint.load(tmp_path, "s1").turns] == [0, 1]
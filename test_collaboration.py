@@ -0,0 +1,72 @@
+import pytest
+
+import main as cli
+from core.archive import TranscriptArchive
+from core.checkpoint import SessionCheckpoint
+
+class ScriptedAgent:
+    """Agent stand-in that records its prompts and can fail on chosen calls."""
+
+    def __init__(self, name: str, failures=()):
+        self.name = name
+        self.model = "scripted"
+        self.prompts = []
+        self.failures = set(failures)
+        self.calls = 0
+
+    def retrieve(self, message):
+        return []
+
+    def process_message(self, message, from_agent=None, relevant_docs=None):
+        self.calls += 1
+        if self.calls in self.failures:
+            raise ConnectionError("model unavailable")
+        self.prompts.append(message)
+        return f"{self.name} reply {len(self.prompts)}"
+
+@pytest.fixture(autouse=True)
+def quiet_console():
+    cli.console.quiet = True
+    yield
+    cli.console.quiet = False
+
+def _collaboration(tmp_path, product_owner, cto, max_retries=0):
+    collaboration = cli.AgentCollaboration(product_owner, cto, checkpoint_dir=tmp_path / "sessions",
+                                           archive=TranscriptArchive(tmp_path / "archive"))
+    collaboration.max_iterations = 6
+    collaboration.max_retries = max_retries
+    collaboration.retry_backoff = 0
+    return collaboration
+
+def test_resume_after_a_failure_reissues_no_completed_turn(tmp_path):
+    # The CTO's second call fails, after three turns have completed
+    product_owner, cto = ScriptedAgent("Product Owner"), ScriptedAgent("CTO", failures={2})
+    failing = _collaboration(tmp_path, product_owner, cto)
+    with pytest.raises(ConnectionError):
+        failing.start_collaboration("Design a data export")
+    session_id = failing.checkpoint.session_id
+    assert len(SessionCheckpoint.load(tmp_path / "sessions", session_id).turns) == 3
+
+    product_owner, cto = ScriptedAgent("Product Owner"), ScriptedAgent("CTO")
+    result = _collaboration(tmp_path, product_owner, cto).resume_collaboration(session_id)
+
+    # Only the failed turn and the ones after it are asked again
+    assert cto.prompts[0] == "Product Owner reply 2"
+    assert len(product_owner.prompts) + len(cto.prompts) == 3
+    assert [turn["iteration"] for turn in result["turns"]] == list(range(6))
+
+def test_transient_failures_are_retried_within_the_turn(tmp_path):
+    product_owner, cto = ScriptedAgent("Product Owner", failures={1, 2}), ScriptedAgent("CTO")
+    result = _collaboration(tmp_path, product_owner, cto, max_retries=2).start_collaboration("Design a data export")
+
+    assert result["turns"][0]["attempts"] == 3
+    assert product_owner.prompts[0] == "Design a data export"
+    assert len(result["turns"]) == 6
+
+def test_exhausted_retries_fail_the_turn(tmp_path):
+    product_owner, cto = ScriptedAgent("Product Owner", failures={1, 2}), ScriptedAgent("CTO")
+    collaboration = _collaboration(tmp_path, product_owner, cto, max_retries=1)
+
+    with pytest.raises(ConnectionError):
+        collaboration.start_collaboration("Design a data export")
+    assert collaboration.checkpoint.turns == []
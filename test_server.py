@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+import main as cli
+from benchmarks.fake_ollama import FakeOllamaServer
+from core.archive import TranscriptArchive
+from core.checkpoint import SessionCheckpoint
+from core.client import AgentClient, AgentServerError
+from core.server import AgentServer
+from utils.config import settings
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    with FakeOllamaServer() as ollama:
+        monkeypatch.setattr(settings, "OLLAMA_API_URL", ollama.url)
+        monkeypatch.setattr(cli.console, "quiet", True)
+        product_owner, cto = cli.create_agents()
+        archive = TranscriptArchive(tmp_path / "archive")
+        server = AgentServer(lambda: cli.AgentCollaboration(product_owner, cto, tmp_path / "sessions", archive))
+        socket_path = tmp_path / "agents.sock"
+        httpd = server.make_httpd(socket_path=socket_path)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield AgentClient(f"unix://{socket_path}")
+        httpd.shutdown()
+        httpd.server_close()
+
+def test_one_shot_collaboration(client):
+    assert client.health()
+    result = client.collaborate("Design a data export", max_iterations=2)
+
+    assert [turn["agent"] for turn in result["turns"]] == ["Product Owner", "CTO"]
+    assert result["prompt"] == "Design a data export"
+
+def test_sessions_keep_their_history_until_closed(client):
+    session_id = client.create_session(max_iterations=1)
+    client.collaborate("Design a data export", session_id=session_id)
+    client.collaborate("Now plan the rollout", session_id=session_id)
+
+    session = client.get_session(session_id)
+    assert [run["prompt"] for run in session["history"]] == ["Design a data export", "Now plan the rollout"]
+    assert all(run["session_id"] == session_id for run in session["history"])
+
+    client.close_session(session_id)
+    with pytest.raises(AgentServerError):
+        client.get_session(session_id)
+
+def test_resume_continues_a_checkpoint_kept_by_the_server(client, tmp_path):
+    checkpoint = SessionCheckpoint.create(tmp_path / "sessions", "Design a data export", max_iterations=2)
+    result = client.collaborate(resume=checkpoint.session_id)
+
+    assert result["checkpoint_id"] == checkpoint.session_id
+    assert result["prompt"] == "Design a data export"
+    assert len(SessionCheckpoint.load(tmp_path / "sessions", checkpoint.session_id).turns) == 2
+
+    with pytest.raises(AgentServerError, match="404"):
+        client.collaborate(resume="no-such-checkpoint")
+
+def test_cli_resumes_through_the_server(client, tmp_path):
+    from typer.testing import CliRunner
+
+    checkpoint = SessionCheckpoint.create(tmp_path / "sessions", "Design a data export", max_iterations=1)
+    result = CliRunner().invoke(cli.app, ["collaborate", "--resume", checkpoint.session_id, "--server", client.url])
+    assert result.exit_code == 0, result.output
+    assert SessionCheckpoint.load(tmp_path / "sessions", checkpoint.session_id).completed
+
+def test_collaborate_requires_a_prompt(client):
+    with pytest.raises(AgentServerError):
+        client.request("POST", "/collaborate", {})
+
+def test_local_only_options_are_rejected_with_a_server():
+    from typer.testing import CliRunner
+
+    result = CliRunner(env={"COLUMNS": "200"}).invoke(cli.app, ["collaborate", "--prompt", "Design a data export",
+                                          "--server", "unix:///nonexistent.sock", "--trace", "trace.json", "--profile"])
+    assert result.exit_code == 2
+    assert "--trace, --profile cannot be combined with --server" in result.output
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+
+# Modules that must only be imported once a command actually needs them
+HEAVY_MODULES = ("langchain_core", "langchain_ollama", "langchain_community", "pandas", "PyPDF2", "pyarrow")
+
+# Wall-clock budget for `python main.py --help`, including interpreter startup
+STARTUP_BUDGET_SECONDS = 1.0
+
+def _loaded_heavy_modules(code: str) -> list:
+    script = f"import sys\n{code}\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    return [name for name in result.stdout.strip().split(",") if name]
+
+def test_cli_import_defers_heavy_dependencies():
+    assert _loaded_heavy_modules("import main") == []
+
+def test_agent_construction_defers_llm_client():
+    code = (
+        "from agents.cto.agent import CTOAgent\n"
+        "from agents.product_owner.agent import ProductOwnerAgent\n"
+        "CTOAgent(); ProductOwnerAgent()"
+    )
+    assert _loaded_heavy_modules(code) == []
+
+def test_cli_help_within_startup_budget():
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "main.py", "--help"], cwd=ROOT, capture_output=True, check=True)
+    elapsed = time.perf_counter() - started
+    assert elapsed < STARTUP_BUDGET_SECONDS, f"main.py --help took {elapsed:.2f}s"
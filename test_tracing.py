@@ -0,0 +1,79 @@
+import json
+import pstats
+import threading
+import tracemalloc
+
+from core.tracing import Tracer, capture_profile, trace_session, traced, tracer
+
+def _spans(events):
+    return {event["name"]: event for event in events if event["ph"] == "X"}
+
+def test_nested_spans_lie_within_their_parent():
+    spans = Tracer(enabled=True)
+    with spans.span("turn", category="collaboration", iteration=0):
+        with spans.span("llm") as args:
+            args["tokens"] = 12
+
+    events = _spans(spans.events())
+    outer, inner = events["turn"], events["llm"]
+    # The viewer nests spans of one thread by time, so the child must fall inside its parent
+    assert inner["tid"] == outer["tid"]
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert outer["args"] == {"iteration": 0}
+    assert inner["args"] == {"tokens": 12}
+
+def test_disabled_tracer_records_nothing():
+    spans = Tracer()
+    with spans.span("turn"):
+        pass
+    assert spans.events() == []
+
+def test_chrome_export_names_every_thread(tmp_path):
+    spans = Tracer(enabled=True)
+    with spans.span("main work"):
+        pass
+    def work():
+        with spans.span("worker work"):
+            pass
+    worker = threading.Thread(target=work, name="fetch-worker")
+    worker.start()
+    worker.join()
+
+    trace = json.loads(spans.export_chrome_trace(tmp_path / "trace.json").read_text())
+    events = trace["traceEvents"]
+    complete = [event for event in events if event["ph"] == "X"]
+    assert {event["name"] for event in complete} == {"main work", "worker work"}
+    assert all({"ts", "dur", "pid", "tid", "cat"} <= event.keys() for event in complete)
+
+    thread_names = {event["tid"]: event["args"]["name"] for event in events
+                    if event["ph"] == "M" and event["name"] == "thread_name"}
+    assert thread_names[_spans(events)["worker work"]["tid"]] == "fetch-worker"
+    assert thread_names[_spans(events)["main work"]["tid"]] == threading.current_thread().name
+
+def test_trace_session_writes_the_trace_and_profile(tmp_path):
+    @traced(category="test")
+    def load_document():
+        return [0] * 1000
+
+    trace_path = tmp_path / "run.json"
+    with trace_session(trace_path, profile=True):
+        load_document()
+
+    assert not tracer.enabled
+    names = {event["name"] for event in json.loads(trace_path.read_text())["traceEvents"]}
+    assert "test_trace_session_writes_the_trace_and_profile.<locals>.load_document" in names
+    stats = pstats.Stats(str(tmp_path / "run.prof"))
+    assert any(function == "load_document" for _, _, function in stats.stats)
+    assert tracemalloc.Snapshot.load(str(tmp_path / "run.tracemalloc")).traces
+
+def test_capture_profile_leaves_an_existing_tracemalloc_session_running(tmp_path):
+    tracemalloc.start()
+    try:
+        with capture_profile(tmp_path / "block"):
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    assert (tmp_path / "block.prof").exists()
+    assert (tmp_path / "block.tracemalloc").exists()
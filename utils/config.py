@@ -16,6 +16,22 @@ class Settings(BaseSettings):
     PRODUCT_OWNER_KB: Path = BASE_DIR / "agents" / "product_owner" / "knowledge_base"
     CTO_KB: Path = BASE_DIR / "agents" / "cto" / "knowledge_base"
     
+    # LLM record/replay ("record" or "replay"), see core/cassette.py
+    LLM_CASSETTE: Optional[Path] = None
+    LLM_CASSETTE_MODE: str = "replay"
+    LLM_CASSETTE_REPLAY_TIMING: bool = False
+    
+    # Collaboration checkpoints and per-turn retry
+    CHECKPOINT_DIR: Path = BASE_DIR / "sessions"
+    TURN_MAX_RETRIES: int = 3
+    TURN_RETRY_BACKOFF: float = 2.0  # seconds, doubled on each retry
+    
+    # Columnar (Parquet) archive of every collaboration turn, see core/archive.py
+    ARCHIVE_ENABLED: bool = True
+    ARCHIVE_DIR: Path = BASE_DIR / "archive"
+    ARCHIVE_BATCH_SIZE: int = 256  # turns buffered per write
+    ARCHIVE_FLUSH_INTERVAL: float = 60.0  # seconds before a partial batch is written
+    
     # Logging Configuration
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"